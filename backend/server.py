@@ -1,20 +1,37 @@
-from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel, ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Callable, Awaitable, Tuple
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
+import base64
+import csv
+import io
+import hashlib
 import asyncio
+import time
+import heapq
+from collections import OrderedDict
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
 import jwt
 from enum import Enum
+from abc import ABC, abstractmethod
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -24,6 +41,68 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Broker messages only need to outlive the change stream round trip between nodes
+WS_EVENTS_TTL_SECONDS = int(os.environ.get('WS_EVENTS_TTL_SECONDS', '300'))
+
+# Index registry, applied at startup. Every hot query filters on one of these.
+INDEXES: Dict[str, List[IndexModel]] = {
+    # Sort keys end in "id" so keyset pagination walks the index without an in-memory sort
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "car_requests": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("buyer_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("ends_at", ASCENDING), ("id", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+        # Top auctions leaderboard, kept in order by the bid_count every accepted bid increments
+        IndexModel([("bid_count", DESCENDING), ("id", ASCENDING)]),
+    ],
+    "bids": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("auction_id", ASCENDING), ("price", ASCENDING), ("id", ASCENDING)]),
+        IndexModel([("dealer_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "ws_events": [
+        IndexModel([("created_at", ASCENDING)], expireAfterSeconds=WS_EVENTS_TTL_SECONDS),
+    ],
+}
+
+async def run_once(name: str, migration: Callable[[], Awaitable[None]]):
+    # One-off data migrations are recorded in db.migrations, so only the first boot pays for
+    # them; a migration interrupted before it is recorded simply runs again
+    if await db.migrations.find_one({"_id": name}) is not None:
+        return
+    await migration()
+    await db.migrations.update_one(
+        {"_id": name}, {"$set": {"completed_at": datetime.utcnow()}}, upsert=True
+    )
+
+async def backfill_bid_summaries():
+    # Auctions created before the bid summary was stored on the auction document
+    async for auction in db.car_requests.find({"bid_count": {"$exists": False}}, {"id": 1}):
+        lowest_bid = await db.bids.find_one({"auction_id": auction["id"]}, sort=[("price", ASCENDING)])
+        bid_count = await db.bids.count_documents({"auction_id": auction["id"]})
+        await db.car_requests.update_one(
+            {"id": auction["id"]},
+            {"$set": {
+                "lowest_price": lowest_bid["price"] if lowest_bid else None,
+                "winning_bid_id": lowest_bid["id"] if lowest_bid else None,
+                "bid_count": bid_count
+            }}
+        )
+
+async def ensure_indexes():
+    for collection_name, indexes in INDEXES.items():
+        try:
+            await db[collection_name].create_indexes(indexes)
+        except Exception as e:
+            # Don't refuse to start over e.g. pre-existing duplicates; surface it loudly instead
+            logger.error(f"Failed to create indexes on {collection_name}: {e}")
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -38,46 +117,323 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 # Security
 security = HTTPBearer()
 
+# bcrypt work runs in a bounded thread pool (bcrypt releases the GIL) so it never blocks
+# the event loop; requests beyond the pending limit are rejected instead of piling up
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '4'))
+PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', '256'))
+
 # WebSocket connection manager
-class ConnectionManager:
+# Channel that every dealer connection is subscribed to for "new_auction" events
+NEW_AUCTION_CHANNEL = "new_auctions"
+
+# Outbound backpressure: messages buffered per connection before it is evicted,
+# and how long a single send may stall before the consumer is considered dead
+WS_SEND_QUEUE_SIZE = int(os.environ.get('WS_SEND_QUEUE_SIZE', '256'))
+WS_SEND_TIMEOUT_SECONDS = float(os.environ.get('WS_SEND_TIMEOUT_SECONDS', '10'))
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_event(event: Dict[str, Any]) -> str:
+    # Every WebSocket frame is encoded exactly once; the resulting string is shared
+    # by all recipient queues. orjson handles datetimes and enums natively.
+    if orjson is not None:
+        return orjson.dumps(event).decode('utf-8')
+    return json.dumps(event, default=_json_default)
+
+def auction_room(auction_id: str) -> str:
+    return f"auction:{auction_id}"
+
+# Pub/sub backend carrying room broadcasts between uvicorn workers and hosts
+WS_BROKER = os.environ.get('WS_BROKER', 'memory')
+NODE_ID = str(uuid.uuid4())
+
+BrokerHandler = Callable[[str, str], Awaitable[None]]
+
+class Broker(ABC):
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.handlers: List[BrokerHandler] = []
+        
+    def subscribe(self, handler: BrokerHandler):
+        self.handlers.append(handler)
+        
+    async def start(self):
+        pass
+        
+    async def stop(self):
+        pass
+        
+    @abstractmethod
+    async def publish(self, channel: str, message: str):
+        ...
+        
+    async def _handle(self, channel: str, message: str):
+        for handler in self.handlers:
+            try:
+                await handler(channel, message)
+            except Exception as e:
+                logger.exception(f"Broker handler for {channel} failed: {e}")
+
+class InMemoryBroker(Broker):
+    # Single-process deployments: publishing is local delivery
+    async def publish(self, channel: str, message: str):
+        await self._handle(channel, message)
+
+class MongoChangeStreamBroker(Broker):
+    # Every node inserts published messages into a shared collection and tails its
+    # change stream for messages from other nodes. Requires a replica set; the TTL index
+    # on the collection is part of INDEXES.
+    def __init__(self, collection, node_id: str = NODE_ID):
+        super().__init__()
+        self.collection = collection
+        self.node_id = node_id
+        self.listener: Optional[asyncio.Task] = None
+        self.resume_token = None
+        
+    async def start(self):
+        if self.listener is None:
+            self.listener = asyncio.create_task(self._listen())
+            
+    async def stop(self):
+        if self.listener is not None:
+            self.listener.cancel()
+            await asyncio.gather(self.listener, return_exceptions=True)
+            self.listener = None
+            
+    async def publish(self, channel: str, message: str):
+        # Local subscribers don't wait for the round trip through the change stream
+        await self._handle(channel, message)
+        await self.collection.insert_one({
+            "channel": channel,
+            "message": message,
+            "origin": self.node_id,
+            "created_at": datetime.utcnow()
+        })
+        
+    async def _listen(self):
+        pipeline = [{"$match": {"operationType": "insert", "fullDocument.origin": {"$ne": self.node_id}}}]
+        while True:
+            try:
+                async with self.collection.watch(pipeline, resume_after=self.resume_token) as stream:
+                    async for change in stream:
+                        self.resume_token = change["_id"]
+                        document = change["fullDocument"]
+                        await self._handle(document["channel"], document["message"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Broker change stream interrupted: {e}")
+                await asyncio.sleep(1)
+
+def create_broker() -> Broker:
+    if WS_BROKER == "mongo":
+        return MongoChangeStreamBroker(db.ws_events)
+    if WS_BROKER != "memory":
+        raise ValueError(f"Unknown WS_BROKER backend: {WS_BROKER}")
+    return InMemoryBroker()
+
+class ClientConnection:
+    # One socket plus its bounded outbound queue, drained by a dedicated writer task
+    def __init__(self, websocket: WebSocket, user_id: str, connection_id: str):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.connection_id = connection_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self.writer_task: Optional[asyncio.Task] = None
+        
+    def enqueue(self, message: str) -> bool:
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+        
+    async def send_text(self, message: str):
+        await asyncio.wait_for(self.websocket.send_text(message), WS_SEND_TIMEOUT_SECONDS)
+
+class ConnectionManager:
+    def __init__(self, broker: Broker):
+        self.broker = broker
+        self.broker.subscribe(self._deliver_to_room)
+        self.active_connections: Dict[str, ClientConnection] = {}
         self.user_connections: Dict[str, List[str]] = {}
+        # Subscription registry: room -> connection ids, connection id -> rooms
+        self.rooms: Dict[str, Set[str]] = {}
+        self.connection_rooms: Dict[str, Set[str]] = {}
+        self.evicted_connections = 0
+        # The loop only holds weak references to tasks; closes of evicted sockets are kept here
+        self.close_tasks: Set[asyncio.Task] = set()
         
     async def connect(self, websocket: WebSocket, user_id: str, connection_id: str):
         await websocket.accept()
-        self.active_connections[connection_id] = websocket
+        connection = ClientConnection(websocket, user_id, connection_id)
+        connection.writer_task = asyncio.create_task(self._writer(connection))
+        self.active_connections[connection_id] = connection
         if user_id not in self.user_connections:
             self.user_connections[user_id] = []
         self.user_connections[user_id].append(connection_id)
         
     def disconnect(self, user_id: str, connection_id: str):
-        if connection_id in self.active_connections:
-            del self.active_connections[connection_id]
+        connection = self.active_connections.pop(connection_id, None)
+        if connection is not None and connection.writer_task is not None:
+            if connection.writer_task is not asyncio.current_task():
+                connection.writer_task.cancel()
         if user_id in self.user_connections:
             self.user_connections[user_id] = [
                 conn for conn in self.user_connections[user_id] if conn != connection_id
             ]
             if not self.user_connections[user_id]:
                 del self.user_connections[user_id]
+        for room in list(self.connection_rooms.get(connection_id, ())):
+            self.leave_room(connection_id, room)
+            
+    def evict(self, connection: ClientConnection, reason: str):
+        if connection.connection_id not in self.active_connections:
+            return
+        logger.warning(f"Evicting WebSocket {connection.connection_id} of user {connection.user_id}: {reason}")
+        self.evicted_connections += 1
+        self.disconnect(connection.user_id, connection.connection_id)
+        # Closing can block on a stalled peer as well, so never await it inline
+        task = asyncio.create_task(self._close(connection.websocket))
+        self.close_tasks.add(task)
+        task.add_done_callback(self.close_tasks.discard)
+        
+    async def _close(self, websocket: WebSocket):
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+            
+    async def _writer(self, connection: ClientConnection):
+        while True:
+            message = await connection.queue.get()
+            try:
+                await connection.send_text(message)
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self.evict(connection, "send timed out")
+                return
+            except Exception as e:
+                self.evict(connection, f"send failed: {e}")
+                return
+                
+    def join_room(self, connection_id: str, room: str):
+        self.rooms.setdefault(room, set()).add(connection_id)
+        self.connection_rooms.setdefault(connection_id, set()).add(room)
+        
+    def leave_room(self, connection_id: str, room: str):
+        members = self.rooms.get(room)
+        if members is not None:
+            members.discard(connection_id)
+            if not members:
+                del self.rooms[room]
+        subscriptions = self.connection_rooms.get(connection_id)
+        if subscriptions is not None:
+            subscriptions.discard(room)
+            if not subscriptions:
+                del self.connection_rooms[connection_id]
+                
+    def _deliver(self, message: str, connection_ids):
+        # Enqueue only; writer tasks send concurrently and a full queue means a slow consumer
+        for connection_id in list(connection_ids):
+            connection = self.active_connections.get(connection_id)
+            if connection is not None and not connection.enqueue(message):
+                self.evict(connection, "outbound queue full")
                 
     async def send_personal_message(self, message: str, user_id: str):
-        if user_id in self.user_connections:
-            for connection_id in self.user_connections[user_id]:
-                if connection_id in self.active_connections:
-                    try:
-                        await self.active_connections[connection_id].send_text(message)
-                    except:
-                        pass
+        self._deliver(message, self.user_connections.get(user_id, ()))
+                        
+    async def broadcast_to_room(self, message: str, room: str):
+        # Goes through the broker so subscribers connected to other workers receive it too
+        await self.broker.publish(room, message)
+        
+    async def _deliver_to_room(self, room: str, message: str):
+        self._deliver(message, self.rooms.get(room, ()))
                         
     async def broadcast_to_auction(self, message: str, auction_id: str):
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except:
-                pass
+        await self.broadcast_to_room(message, auction_room(auction_id))
+        
+    async def broadcast_new_auction(self, message: str):
+        await self.broadcast_to_room(message, NEW_AUCTION_CHANNEL)
+        
+    def room_stats(self) -> Dict[str, Any]:
+        auction_rooms = {
+            room: len(members) for room, members in self.rooms.items() if room != NEW_AUCTION_CHANNEL
+        }
+        return {
+            "auction_rooms": len(auction_rooms),
+            "auction_subscriptions": sum(auction_rooms.values()),
+            "largest_auction_room": max(auction_rooms.values(), default=0),
+            "new_auction_subscribers": len(self.rooms.get(NEW_AUCTION_CHANNEL, ())),
+        }
+        
+    def queue_stats(self) -> Dict[str, Any]:
+        return {
+            "queued_messages": sum(conn.queue.qsize() for conn in self.active_connections.values()),
+            "evicted_connections": self.evicted_connections,
+        }
+
+manager = ConnectionManager(create_broker())
+
+# In-process event bus: handlers publish and return immediately, dispatcher tasks deliver
+EVENT_BUS_DISPATCHERS = int(os.environ.get('EVENT_BUS_DISPATCHERS', '4'))
+EVENT_BUS_QUEUE_SIZE = int(os.environ.get('EVENT_BUS_QUEUE_SIZE', '10000'))
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+class EventBus:
+    def __init__(self, dispatchers: int = EVENT_BUS_DISPATCHERS, queue_size: int = EVENT_BUS_QUEUE_SIZE):
+        # One queue per dispatcher; events sharing a key (e.g. an auction) stay in order
+        self.queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=queue_size) for _ in range(dispatchers)]
+        self.handlers: Dict[str, List[EventHandler]] = {}
+        self.tasks: List[asyncio.Task] = []
+        self.published_events = 0
+        self.dropped_events = 0
+        
+    def subscribe(self, event_type: str, handler: EventHandler):
+        self.handlers.setdefault(event_type, []).append(handler)
+        
+    def publish(self, event_type: str, payload: Dict[str, Any], key: Optional[str] = None):
+        queue = self.queues[hash(key or event_type) % len(self.queues)]
+        try:
+            queue.put_nowait((event_type, payload))
+            self.published_events += 1
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.error(f"Event bus queue full, dropping {event_type} event")
+            
+    def start(self):
+        if not self.tasks:
+            self.tasks = [asyncio.create_task(self._dispatch(queue)) for queue in self.queues]
+            
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        
+    async def _dispatch(self, queue: asyncio.Queue):
+        while True:
+            event_type, payload = await queue.get()
+            for handler in self.handlers.get(event_type, ()):
+                try:
+                    await handler(payload)
+                except Exception as e:
+                    logger.exception(f"Event handler for {event_type} failed: {e}")
+                    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "published_events": self.published_events,
+            "dropped_events": self.dropped_events,
+            "pending_events": sum(queue.qsize() for queue in self.queues),
+        }
 
-manager = ConnectionManager()
+event_bus = EventBus()
 
 # Enums
 class UserRole(str, Enum):
@@ -159,6 +515,9 @@ class CarRequest(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     ends_at: datetime = Field(default_factory=lambda: datetime.utcnow() + timedelta(hours=24))
     winning_bid_id: Optional[str] = None
+    # Bid summary maintained on every accepted bid
+    lowest_price: Optional[float] = None
+    bid_count: int = 0
 
 class CarRequestCreate(BaseModel):
     title: str
@@ -194,6 +553,15 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
+class TokenClaims(BaseModel):
+    email: str = Field(alias="sub")
+    id: str = Field(alias="uid")
+    role: UserRole
+    dealer_tier: Optional[DealerTier] = Field(default=None, alias="tier")
+    license_verified: bool = Field(default=True, alias="lv")
+    is_active: bool = Field(default=True, alias="act")
+    version: int = Field(default=0, alias="ver")
+
 # Utility functions
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
@@ -201,6 +569,60 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+class PasswordPool:
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        
+    async def run(self, func: Callable, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many authentication requests, please retry",
+                headers={"Retry-After": "1"}
+            )
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+            
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+        
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, password, hashed_password)
+        
+    def stats(self) -> Dict[str, Any]:
+        return {"pending": self.pending, "rejected": self.rejected, "max_pending": self.max_pending}
+
+password_pool = PasswordPool()
+
+def build_token_claims(user_data: dict) -> dict:
+    # Claims needed to authorize read-only endpoints without loading the user
+    dealer_tier = user_data.get("dealer_tier")
+    return {
+        "sub": user_data["email"],
+        "uid": user_data["id"],
+        "role": UserRole(user_data["role"]).value,
+        "tier": DealerTier(dealer_tier).value if dealer_tier else None,
+        "lv": user_data.get("license_verified", True),
+        "act": user_data.get("is_active", True),
+        "ver": user_data.get("token_version", 0),
+    }
+
+# Changing any of these user fields makes previously issued claims stale
+TOKEN_CLAIM_FIELDS = {"email", "role", "dealer_tier", "license_verified", "is_active"}
+
+def user_update_operation(update_fields: dict) -> dict:
+    operation = {"$set": update_fields}
+    if TOKEN_CLAIM_FIELDS & update_fields.keys():
+        operation["$inc"] = {"token_version": 1}
+    return operation
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -211,21 +633,309 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
+# TTL + LRU caches for the auth path. Writers invalidate by user id through the broker
+# so every worker drops its copy.
+USER_CACHE_TTL_SECONDS = float(os.environ.get('USER_CACHE_TTL_SECONDS', '30'))
+USER_CACHE_MAX_SIZE = int(os.environ.get('USER_CACHE_MAX_SIZE', '10000'))
+USER_CACHE_CHANNEL = "cache:users"
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float = USER_CACHE_TTL_SECONDS, max_size: int = USER_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Bumped on every invalidation, so a read that raced one can skip caching its result
+        self.generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+        
+    def set(self, key: str, value: Any):
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self._remove(next(iter(self.entries)))
+            
+    def generation(self, key: str) -> int:
+        return self.generations.get(key, 0)
+        
+    def invalidate(self, key: str):
+        self.generations[key] = self.generation(key) + 1
+        self._remove(key)
+        
+    def _remove(self, key: str):
+        self.entries.pop(key, None)
+        
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+class UserCache(TTLCache):
+    # Keyed by token subject (email), invalidated by user id
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys_by_user_id: Dict[str, str] = {}
+        self.invalidations = 0
+        
+    def set(self, subject: str, user: User):
+        self.keys_by_user_id[user.id] = subject
+        super().set(subject, user)
+            
+    def invalidate(self, user_id: str):
+        # A miss is keyed by subject and doesn't know the user id until the read returns,
+        # so readers compare the cache-wide count of invalidations instead
+        self.invalidations += 1
+        subject = self.keys_by_user_id.get(user_id)
+        if subject is not None:
+            self._remove(subject)
+            
+    def _remove(self, subject: str):
+        entry = self.entries.pop(subject, None)
+        if entry is not None and self.keys_by_user_id.get(entry[1].id) == subject:
+            del self.keys_by_user_id[entry[1].id]
+
+user_cache = UserCache()
+# Current token version per user id; -1 marks a deleted user
+token_versions = TTLCache()
+
+async def invalidate_user(user_id: str):
+    await manager.broker.publish(USER_CACHE_CHANNEL, user_id)
+
+async def _handle_user_invalidation(channel: str, message: str):
+    if channel == USER_CACHE_CHANNEL:
+        user_cache.invalidate(message)
+        token_versions.invalidate(message)
+
+manager.broker.subscribe(_handle_user_invalidation)
+
+def _decode_token(credentials: HTTPAuthorizationCredentials) -> Dict[str, Any]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if payload.get("sub") is None:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    email: str = _decode_token(credentials)["sub"]
     
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+    
+    invalidations = user_cache.invalidations
     user_data = await db.users.find_one({"email": email})
     if user_data is None:
         raise HTTPException(status_code=401, detail="User not found")
     
-    return User(**user_data)
+    user = User(**user_data)
+    # A user invalidated while the read was in flight may have been read before the write
+    if user_cache.invalidations == invalidations:
+        user_cache.set(email, user)
+    return user
+
+async def current_token_version(user_id: str) -> int:
+    version = token_versions.get(user_id)
+    if version is None:
+        generation = token_versions.generation(user_id)
+        user_data = await db.users.find_one({"id": user_id}, {"token_version": 1})
+        version = user_data.get("token_version", 0) if user_data else -1
+        if token_versions.generation(user_id) == generation:
+            token_versions.set(user_id, version)
+    return version
+
+async def get_token_claims(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenClaims:
+    # Read-only endpoints authorize from the token alone; the database is only consulted
+    # when the token's version is stale or the token predates embedded claims
+    payload = _decode_token(credentials)
+    if "uid" not in payload or "ver" not in payload:
+        user = await get_current_user(credentials)
+        return TokenClaims(**build_token_claims(user.dict()))
+    
+    version = await current_token_version(payload["uid"])
+    if version < 0:
+        raise HTTPException(status_code=401, detail="User not found")
+    if version == payload["ver"]:
+        return TokenClaims(**payload)
+    
+    generation = token_versions.generation(payload["uid"])
+    user_data = await db.users.find_one({"id": payload["uid"]}, {"password": 0})
+    if user_data is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    if token_versions.generation(payload["uid"]) == generation:
+        token_versions.set(payload["uid"], user_data.get("token_version", 0))
+    return TokenClaims(**build_token_claims(user_data))
+
+# Keyset pagination. Every list endpoint sorts on an indexed key with "id" as the
+# tie-breaker; the cursor carries the last row's (key, id) and the next cursor is
+# returned in the X-Next-Cursor header, absent on the last page.
+DEFAULT_PAGE_SIZE = int(os.environ.get('DEFAULT_PAGE_SIZE', '1000'))
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '1000'))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(document: dict, sort_field: str) -> str:
+    value = document.get(sort_field)
+    if isinstance(value, datetime):
+        key = {"dt": value.isoformat()}
+    else:
+        key = {"v": value}
+    raw = json.dumps([key, document.get("id")]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    try:
+        key, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        value = datetime.fromisoformat(key["dt"]) if "dt" in key else key["v"]
+        return value, last_id
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_filter(query: dict, sort_field: str, direction: int, after: Optional[str] = None) -> dict:
+    # Rows strictly past the cursor in (sort_field, id) order
+    if not after:
+        return query
+    value, last_id = decode_cursor(after)
+    op = "$gt" if direction == ASCENDING else "$lt"
+    return {"$and": [query, {"$or": [
+        {sort_field: {op: value}},
+        {sort_field: value, "id": {op: last_id}}
+    ]}]}
+
+async def fetch_page(
+    collection,
+    query: dict,
+    sort_field: str,
+    direction: int,
+    limit: int,
+    after: Optional[str] = None,
+    projection: Optional[dict] = None
+) -> Tuple[List[dict], Optional[str]]:
+    query = keyset_filter(query, sort_field, direction, after)
+    # One extra row tells us whether another page exists
+    documents = await collection.find(query, projection).sort(
+        [(sort_field, direction), ("id", direction)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = encode_cursor(documents[limit - 1], sort_field) if len(documents) > limit else None
+    return documents[:limit], next_cursor
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+# Response cache for admin read endpoints. Entries hold the encoded body and its ETag and
+# are tagged with the data they depend on; writers invalidate tags through the broker.
+ADMIN_CACHE_TTL_SECONDS = float(os.environ.get('ADMIN_CACHE_TTL_SECONDS', '30'))
+ADMIN_CACHE_MAX_SIZE = int(os.environ.get('ADMIN_CACHE_MAX_SIZE', '256'))
+ADMIN_CACHE_CHANNEL = "cache:admin"
+
+class ResponseCache(TTLCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys_by_tag: Dict[str, Set[str]] = {}
+        self.tags_by_key: Dict[str, Set[str]] = {}
+        # Bumped on every invalidation, so a build can tell whether its tags changed under it
+        self.tag_generations: Dict[str, int] = {}
+        
+    def tag_generation(self, tags: List[str]) -> Tuple[int, ...]:
+        return tuple(self.tag_generations.get(tag, 0) for tag in tags)
+        
+    def set(self, key: str, value: Tuple[bytes, str, Dict[str, str]], tags: List[str] = ()):
+        self._remove(key)
+        self.tags_by_key[key] = set(tags)
+        for tag in tags:
+            self.keys_by_tag.setdefault(tag, set()).add(key)
+        super().set(key, value)
+        
+    def invalidate_tags(self, tags: List[str]):
+        for tag in tags:
+            self.tag_generations[tag] = self.tag_generations.get(tag, 0) + 1
+            for key in self.keys_by_tag.pop(tag, ()):
+                self._remove(key)
+                
+    def _remove(self, key: str):
+        # Every removal, including TTL expiry and LRU eviction, leaves the tag index too
+        super()._remove(key)
+        for tag in self.tags_by_key.pop(key, ()):
+            keys = self.keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.keys_by_tag[tag]
+
+response_cache = ResponseCache(ttl_seconds=ADMIN_CACHE_TTL_SECONDS, max_size=ADMIN_CACHE_MAX_SIZE)
+
+# The loop only holds weak references to tasks; cross-node publishes are kept alive here
+admin_cache_publishes: Set[asyncio.Task] = set()
+
+def invalidate_admin_cache(*tags: str):
+    # This worker's copies are dropped before the writer responds. Other workers hear about it
+    # through the broker off the request path (a ws_events insert with WS_BROKER=mongo); local
+    # delivery of that message invalidates again, which is harmless.
+    response_cache.invalidate_tags(list(tags))
+    task = asyncio.create_task(manager.broker.publish(ADMIN_CACHE_CHANNEL, ",".join(tags)))
+    admin_cache_publishes.add(task)
+    task.add_done_callback(admin_cache_publishes.discard)
+
+async def _handle_admin_cache_invalidation(channel: str, message: str):
+    # Every writer invalidates explicitly before responding; user invalidations imply the
+    # users tag. WebSocket room traffic is never relied on, it may be dropped by the event bus.
+    if channel == ADMIN_CACHE_CHANNEL:
+        response_cache.invalidate_tags(message.split(","))
+    elif channel == USER_CACHE_CHANNEL:
+        response_cache.invalidate_tags(["users"])
+
+manager.broker.subscribe(_handle_admin_cache_invalidation)
+
+async def cached_body(
+    request: Request,
+    tags: List[str],
+    build: Callable[[], Awaitable[Tuple[Any, Optional[str]]]]
+) -> Tuple[bytes, str, Dict[str, str]]:
+    # build returns (payload, next_cursor); the body is encoded once and served from cache
+    # until a tag is invalidated or the TTL lapses
+    key = f"{request.url.path}?{request.url.query}"
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.tag_generation(tags)
+        payload, next_cursor = await build()
+        body = encode_event(payload).encode('utf-8')
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+        entry = (body, etag, headers)
+        # A write invalidated a tag while build() ran, so the result may predate it: serve it
+        # to this request only
+        if response_cache.tag_generation(tags) == generation:
+            response_cache.set(key, entry, tags)
+    return entry
+
+async def cached_response(
+    request: Request,
+    tags: List[str],
+    build: Callable[[], Awaitable[Tuple[Any, Optional[str]]]]
+) -> Response:
+    # A cached body with its ETag, If-None-Match answered by a 304
+    body, etag, headers = await cached_body(request, tags, build)
+    
+    headers = {**headers, "ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Authentication routes
 @api_router.post("/register", response_model=Token)
@@ -236,7 +946,7 @@ async def register(user_data: UserRegister):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Hash password
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await password_pool.hash(user_data.password)
     
     # Create user
     user = User(
@@ -251,19 +961,23 @@ async def register(user_data: UserRegister):
     # Store user with hashed password
     user_dict = user.dict()
     user_dict["password"] = hashed_password
+    user_dict["token_version"] = 0
     await db.users.insert_one(user_dict)
+    await increment_counters({key: 1 for key in user_counter_keys(user.role, user.dealer_tier)})
+    await record_daily_stats({f"registrations.{user.role.value}": 1}, user.created_at)
+    invalidate_admin_cache("users")
     
     # Create token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data=build_token_claims(user_dict))
     return {"access_token": access_token, "token_type": "bearer"}
 
 @api_router.post("/login", response_model=Token)
 async def login(user_data: UserLogin):
     user = await db.users.find_one({"email": user_data.email})
-    if not user or not verify_password(user_data.password, user["password"]):
+    if not user or not await password_pool.verify(user_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    access_token = create_access_token(data={"sub": user["email"]})
+    access_token = create_access_token(data=build_token_claims(user))
     return {"access_token": access_token, "token_type": "bearer"}
 
 @api_router.get("/me", response_model=User)
@@ -302,11 +1016,12 @@ async def update_profile(profile_data: UserUpdate, current_user: User = Depends(
         
         result = await db.users.update_one(
             {"id": current_user.id},
-            {"$set": update_fields}
+            user_update_operation(update_fields)
         )
         
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
+        await invalidate_user(current_user.id)
         
         # Fetch and return updated user
         updated_user = await db.users.find_one({"id": current_user.id})
@@ -334,29 +1049,39 @@ async def create_car_request(request_data: CarRequestCreate, current_user: User
     )
     
     await db.car_requests.insert_one(car_request.dict())
+    await increment_counters({"auctions_total": 1, f"auctions_{car_request.status.value}": 1})
+    await record_daily_stats({"auctions": 1}, car_request.created_at)
+    
+    expiry_scheduler.schedule(car_request.id, car_request.ends_at)
+    invalidate_admin_cache("auctions")
     
     # Notify all dealers about new auction
-    await manager.broadcast_to_auction(
-        json.dumps({
-            "type": "new_auction",
-            "auction": {k: v.isoformat() if isinstance(v, datetime) else v for k, v in car_request.dict().items()}
-        }),
-        car_request.id
-    )
+    event_bus.publish("new_auction", {"auction": car_request.dict()}, key=car_request.id)
     
     return car_request
 
 @api_router.get("/car-requests", response_model=List[CarRequest])
-async def get_car_requests(current_user: User = Depends(get_current_user)):
+async def get_car_requests(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
     if current_user.role == UserRole.BUYER:
-        requests = await db.car_requests.find({"buyer_id": current_user.id}).to_list(1000)
+        requests, next_cursor = await fetch_page(
+            db.car_requests, {"buyer_id": current_user.id}, "created_at", DESCENDING, limit, after
+        )
     else:
-        requests = await db.car_requests.find({"status": AuctionStatus.ACTIVE}).to_list(1000)
+        # Dealers see active auctions, ending soonest first
+        requests, next_cursor = await fetch_page(
+            db.car_requests, {"status": AuctionStatus.ACTIVE}, "ends_at", ASCENDING, limit, after
+        )
     
+    set_next_cursor(response, next_cursor)
     return [CarRequest(**request) for request in requests]
 
 @api_router.get("/car-requests/{request_id}", response_model=CarRequest)
-async def get_car_request(request_id: str, current_user: User = Depends(get_current_user)):
+async def get_car_request(request_id: str, current_user: TokenClaims = Depends(get_token_claims)):
     request_data = await db.car_requests.find_one({"id": request_id})
     if not request_data:
         raise HTTPException(status_code=404, detail="Car request not found")
@@ -364,6 +1089,320 @@ async def get_car_request(request_id: str, current_user: User = Depends(get_curr
     return CarRequest(**request_data)
 
 # Bidding routes
+def apply_bid_status(bid: dict, winning_bid_id: Optional[str]) -> dict:
+    # Auctions without a winning pointer predate it and keep their stored statuses
+    if winning_bid_id is not None:
+        bid["status"] = BidStatus.WINNING if bid.get("id") == winning_bid_id else BidStatus.LOST
+    return bid
+
+def bid_rejection(auction: Optional[dict], price: float) -> Optional[HTTPException]:
+    if not auction:
+        return HTTPException(status_code=404, detail="Auction not found")
+    
+    if auction["status"] != AuctionStatus.ACTIVE:
+        return HTTPException(status_code=400, detail="Auction is not active")
+    
+    if datetime.utcnow() > auction["ends_at"]:
+        return HTTPException(status_code=400, detail="Auction has ended")
+    
+    # Check if bid is lower than current lowest bid
+    lowest_price = auction.get("lowest_price")
+    if lowest_price is not None and price >= lowest_price:
+        return HTTPException(status_code=400, detail="Bid must be lower than current lowest bid")
+    
+    # Check if bid is within budget
+    if price > auction["max_budget"]:
+        return HTTPException(status_code=400, detail="Bid exceeds maximum budget")
+    
+    return None
+
+async def raise_bid_rejection(auction_id: str, price: float):
+    # Only runs after the conditional write rejected a bid, to report which rule failed
+    auction = await db.car_requests.find_one({"id": auction_id})
+    # No rule fails on re-read when a concurrent lower bid won the race in between
+    raise bid_rejection(auction, price) or HTTPException(
+        status_code=400, detail="Bid must be lower than current lowest bid"
+    )
+
+# Optional in-process bid engine for hot auctions: one actor per auction serializes bids
+# through a queue, validates them against an in-memory snapshot of the auction's bid summary
+# and persists accepted bids in batches. Enable with BID_ENGINE=orderbook.
+BID_ENGINE = os.environ.get('BID_ENGINE', 'direct')
+ORDER_BOOK_BATCH_SIZE = int(os.environ.get('ORDER_BOOK_BATCH_SIZE', '100'))
+ORDER_BOOK_IDLE_SECONDS = float(os.environ.get('ORDER_BOOK_IDLE_SECONDS', '60'))
+
+class AuctionOrderBook:
+    def __init__(self, auction_id: str, engine: "BidEngine"):
+        self.auction_id = auction_id
+        self.engine = engine
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.auction: Optional[dict] = None
+        self.task: Optional[asyncio.Task] = None
+        
+    async def load(self):
+        # (Re)build state from the database, e.g. after a restart or a conflicting writer. The
+        # auction's bid summary is all validation needs, whatever the number of bids.
+        self.auction = await db.car_requests.find_one({"id": self.auction_id}, {"_id": 0})
+        
+    async def run(self):
+        while True:
+            try:
+                first = await asyncio.wait_for(self.queue.get(), ORDER_BOOK_IDLE_SECONDS)
+            except asyncio.TimeoutError:
+                if self.queue.empty():
+                    self.engine.retire(self)
+                    return
+                continue
+            batch = [first]
+            while len(batch) < ORDER_BOOK_BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self.process(batch)
+            except Exception as e:
+                logger.exception(f"Order book for auction {self.auction_id} failed: {e}")
+                self.auction = None
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(HTTPException(status_code=503, detail="Bid could not be placed, please retry"))
+                        
+    async def process(self, batch: List[Tuple[Bid, asyncio.Future]]):
+        pending = batch
+        while pending:
+            if self.auction is None:
+                await self.load()
+            previous_lowest = self.auction.get("lowest_price") if self.auction else None
+            accepted = []
+            for bid, future in pending:
+                error = bid_rejection(self.auction, bid.price)
+                if error is not None:
+                    future.set_exception(error)
+                    continue
+                self.auction["lowest_price"] = bid.price
+                self.auction["winning_bid_id"] = bid.id
+                self.auction["bid_count"] = self.auction.get("bid_count", 0) + 1
+                accepted.append((bid, future))
+            if not accepted:
+                return
+            
+            # Bids are stored before the auction points at them
+            documents = [bid.dict() for bid, _ in accepted]
+            await self.insert(documents)
+            
+            # Guarded on the price this batch was validated against, so a write from another
+            # worker or from the direct path forces a rebuild instead of being overwritten
+            winning_bid = accepted[-1][0]
+            result = await db.car_requests.update_one(
+                {"id": self.auction_id, "status": AuctionStatus.ACTIVE, "lowest_price": previous_lowest},
+                {
+                    "$set": {"lowest_price": winning_bid.price, "winning_bid_id": winning_bid.id},
+                    "$inc": {"bid_count": len(accepted)}
+                }
+            )
+            if result.modified_count == 0:
+                await db.bids.delete_many({"id": {"$in": [document["id"] for document in documents]}})
+                self.auction = None
+                pending = accepted
+                continue
+            
+            for bid, future in accepted:
+                bid.status = BidStatus.WINNING if bid is winning_bid else BidStatus.LOST
+                future.set_result(bid)
+            await increment_counters({"bids_total": len(accepted)})
+            await record_daily_stats({"bids": len(accepted)})
+            return
+            
+    async def insert(self, documents: List[dict]):
+        try:
+            await db.bids.insert_many(documents)
+        except BulkWriteError as e:
+            # Ordered insert: withdraw the prefix that was written before the failure
+            written = [document["id"] for document in documents[:e.details.get("nInserted", 0)]]
+            if written:
+                await db.bids.delete_many({"id": {"$in": written}})
+            raise
+
+class BidEngine:
+    def __init__(self):
+        self.books: Dict[str, AuctionOrderBook] = {}
+        self.submitted_bids = 0
+        
+    async def submit(self, bid: Bid) -> Bid:
+        book = self.books.get(bid.auction_id)
+        if book is None:
+            book = AuctionOrderBook(bid.auction_id, self)
+            book.task = asyncio.create_task(book.run())
+            self.books[bid.auction_id] = book
+        future = asyncio.get_running_loop().create_future()
+        book.queue.put_nowait((bid, future))
+        self.submitted_bids += 1
+        return await future
+        
+    def invalidate(self, auction_id: str):
+        # Auction changed outside the engine (e.g. status update); reload before the next bid
+        book = self.books.get(auction_id)
+        if book is not None:
+            book.auction = None
+            
+    def retire(self, book: AuctionOrderBook):
+        if self.books.get(book.auction_id) is book:
+            del self.books[book.auction_id]
+            
+    async def stop(self):
+        tasks = [book.task for book in self.books.values() if book.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.books = {}
+        
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_order_books": len(self.books),
+            "queued_bids": sum(book.queue.qsize() for book in self.books.values()),
+            "submitted_bids": self.submitted_bids,
+        }
+
+bid_engine = BidEngine() if BID_ENGINE == "orderbook" else None
+
+# Write-behind buffer for the direct path: bid inserts from concurrent requests are grouped
+# into insert_many batches flushed on size or after a few milliseconds
+BID_WRITE_BATCH_SIZE = int(os.environ.get('BID_WRITE_BATCH_SIZE', '200'))
+BID_WRITE_FLUSH_MS = float(os.environ.get('BID_WRITE_FLUSH_MS', '5'))
+
+class BidWriteBuffer:
+    def __init__(self, batch_size: int = BID_WRITE_BATCH_SIZE, flush_ms: float = BID_WRITE_FLUSH_MS):
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        self.pending: List[Tuple[dict, asyncio.Future]] = []
+        self.timer: Optional[asyncio.Task] = None
+        # The loop only holds weak references to tasks; in-flight flushes are kept alive here
+        self.tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.written = 0
+        
+    async def write(self, document: dict):
+        # Resolves once the batch holding the document is acknowledged by Mongo, so the
+        # caller never reports a bid that isn't durable. Only bids that already claimed
+        # their auction are written, so every stored bid is counted.
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((document, future))
+        if len(self.pending) >= self.batch_size:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self._spawn(self.flush())
+        elif self.timer is None:
+            self.timer = self._spawn(self._flush_later())
+        await future
+        
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+        
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_ms / 1000)
+        self.timer = None
+        await self.flush()
+        
+    async def flush(self):
+        batch, self.pending = self.pending[:self.batch_size], self.pending[self.batch_size:]
+        if not batch:
+            return
+        if len(self.pending) >= self.batch_size:
+            self._spawn(self.flush())
+        elif self.pending and self.timer is None:
+            self.timer = self._spawn(self._flush_later())
+        failed: Dict[int, Exception] = {}
+        try:
+            await db.bids.insert_many([document for document, _ in batch], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed[error["index"]] = e
+        except Exception as e:
+            failed = {index: e for index in range(len(batch))}
+        self.batches += 1
+        self.written += len(batch) - len(failed)
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in failed:
+                future.set_exception(failed[index])
+            else:
+                future.set_result(None)
+        await increment_counters({"bids_total": len(batch) - len(failed)})
+        await record_daily_stats({"bids": len(batch) - len(failed)})
+                
+    async def close(self):
+        # Shutdown: write whatever is buffered and wait for flushes already in flight
+        while self.pending:
+            await self.flush()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "written": self.written,
+            "average_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self.pending),
+        }
+
+bid_writer = BidWriteBuffer()
+
+def bid_claim_filter(auction_id: str, price: float) -> dict:
+    # Every auction rule a bid must satisfy, evaluated atomically by the conditional write
+    return {
+        "id": auction_id,
+        "status": AuctionStatus.ACTIVE,
+        "ends_at": {"$gte": datetime.utcnow()},
+        "max_budget": {"$gte": price},
+        "$or": [{"lowest_price": None}, {"lowest_price": {"$gt": price}}]
+    }
+
+async def place_bid(bid: Bid) -> dict:
+    # The bid claims the lowest price with one conditional write and is then made durable.
+    # The filter carries every auction rule, so concurrent bids are applied one at a time
+    # and each must undercut the last; a rejected bid costs the claim and one re-read and
+    # is never stored or counted. Earlier bids are not rewritten, their status is derived
+    # from winning_bid_id on read.
+    previous = await db.car_requests.find_one_and_update(
+        bid_claim_filter(bid.auction_id, bid.price),
+        {"$set": {"lowest_price": bid.price, "winning_bid_id": bid.id}, "$inc": {"bid_count": 1}},
+        projection={"_id": 0, "bid_count": 1},
+        return_document=ReturnDocument.BEFORE
+    )
+    if previous is None:
+        await raise_bid_rejection(bid.auction_id, bid.price)
+    
+    try:
+        await bid_writer.write(bid.dict())
+    except Exception:
+        await release_bid_claim(bid)
+        raise
+    return {"lowest_price": bid.price, "bid_count": previous.get("bid_count", 0) + 1}
+
+async def release_bid_claim(bid: Bid):
+    # The claimed bid was never stored. Unless a lower bid has claimed the auction since,
+    # point it at the lowest stored bid: the bid this claim displaced may have failed to
+    # store as well, so it can't be restored blindly. The count drops either way.
+    lowest = await db.bids.find_one(
+        {"auction_id": bid.auction_id},
+        {"_id": 0, "id": 1, "price": 1},
+        sort=[("price", ASCENDING), ("id", ASCENDING)]
+    )
+    result = await db.car_requests.update_one(
+        {"id": bid.auction_id, "winning_bid_id": bid.id},
+        {
+            "$set": {
+                "lowest_price": lowest["price"] if lowest else None,
+                "winning_bid_id": lowest["id"] if lowest else None
+            },
+            "$inc": {"bid_count": -1}
+        }
+    )
+    if result.modified_count == 0:
+        await db.car_requests.update_one({"id": bid.auction_id}, {"$inc": {"bid_count": -1}})
+
 @api_router.post("/bids", response_model=Bid)
 async def create_bid(bid_data: BidCreate, current_user: User = Depends(get_current_user)):
     if current_user.role != UserRole.DEALER:
@@ -377,26 +1416,6 @@ async def create_bid(bid_data: BidCreate, current_user: User = Depends(get_curre
     if not current_user.is_active:
         raise HTTPException(status_code=403, detail="Your account is not active")
     
-    # Check if auction exists and is active
-    auction = await db.car_requests.find_one({"id": bid_data.auction_id})
-    if not auction:
-        raise HTTPException(status_code=404, detail="Auction not found")
-    
-    if auction["status"] != AuctionStatus.ACTIVE:
-        raise HTTPException(status_code=400, detail="Auction is not active")
-    
-    if datetime.utcnow() > auction["ends_at"]:
-        raise HTTPException(status_code=400, detail="Auction has ended")
-    
-    # Check if bid is lower than current lowest bid
-    current_bids = await db.bids.find({"auction_id": bid_data.auction_id}).sort("price", 1).to_list(1000)
-    if current_bids and bid_data.price >= current_bids[0]["price"]:
-        raise HTTPException(status_code=400, detail="Bid must be lower than current lowest bid")
-    
-    # Check if bid is within budget
-    if bid_data.price > auction["max_budget"]:
-        raise HTTPException(status_code=400, detail="Bid exceeds maximum budget")
-    
     # Create bid
     bid = Bid(
         auction_id=bid_data.auction_id,
@@ -404,54 +1423,53 @@ async def create_bid(bid_data: BidCreate, current_user: User = Depends(get_curre
         dealer_name=current_user.name,
         dealer_tier=current_user.dealer_tier,
         price=bid_data.price,
-        message=bid_data.message
-    )
-    
-    await db.bids.insert_one(bid.dict())
-    
-    # Update bid statuses
-    await db.bids.update_many(
-        {"auction_id": bid_data.auction_id, "id": {"$ne": bid.id}},
-        {"$set": {"status": BidStatus.LOST}}
-    )
-    
-    await db.bids.update_one(
-        {"id": bid.id},
-        {"$set": {"status": BidStatus.WINNING}}
+        message=bid_data.message,
+        status=BidStatus.WINNING
     )
     
-    # Update the bid object to reflect the winning status
-    bid.status = BidStatus.WINNING
+    if bid_engine is not None:
+        bid = await bid_engine.submit(bid)
+    else:
+        await place_bid(bid)
+    invalidate_admin_cache("bids", "auctions")
     
     # Broadcast bid update
-    bid_dict = bid.dict()
-    # Convert datetime objects to ISO format strings for JSON serialization
-    if "created_at" in bid_dict and bid_dict["created_at"]:
-        bid_dict["created_at"] = bid_dict["created_at"].isoformat()
-    
-    await manager.broadcast_to_auction(
-        json.dumps({
-            "type": "new_bid",
-            "bid": bid_dict,
-            "auction_id": bid_data.auction_id
-        }),
-        bid_data.auction_id
-    )
+    event_bus.publish("new_bid", {"bid": bid.dict(), "auction_id": bid_data.auction_id}, key=bid_data.auction_id)
     
     return bid
 
 @api_router.get("/bids/{auction_id}", response_model=List[Bid])
-async def get_auction_bids(auction_id: str, current_user: User = Depends(get_current_user)):
-    bids = await db.bids.find({"auction_id": auction_id}).sort("price", 1).to_list(1000)
-    return [Bid(**bid) for bid in bids]
+async def get_auction_bids(
+    auction_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
+    bids, next_cursor = await fetch_page(db.bids, {"auction_id": auction_id}, "price", ASCENDING, limit, after)
+    set_next_cursor(response, next_cursor)
+    auction = await db.car_requests.find_one({"id": auction_id}, {"winning_bid_id": 1})
+    winning_bid_id = auction.get("winning_bid_id") if auction else None
+    return [Bid(**apply_bid_status(bid, winning_bid_id)) for bid in bids]
 
 @api_router.get("/my-bids", response_model=List[Bid])
-async def get_my_bids(current_user: User = Depends(get_current_user)):
+async def get_my_bids(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
     if current_user.role != UserRole.DEALER:
         raise HTTPException(status_code=403, detail="Only dealers can view their bids")
     
-    bids = await db.bids.find({"dealer_id": current_user.id}).sort("created_at", -1).to_list(1000)
-    return [Bid(**bid) for bid in bids]
+    bids, next_cursor = await fetch_page(db.bids, {"dealer_id": current_user.id}, "created_at", DESCENDING, limit, after)
+    set_next_cursor(response, next_cursor)
+    auction_ids = list({bid["auction_id"] for bid in bids})
+    auctions = await db.car_requests.find(
+        {"id": {"$in": auction_ids}}, {"id": 1, "winning_bid_id": 1}
+    ).to_list(None)
+    winning_bid_ids = {auction["id"]: auction.get("winning_bid_id") for auction in auctions}
+    return [Bid(**apply_bid_status(bid, winning_bid_ids.get(bid["auction_id"]))) for bid in bids]
 
 # WebSocket endpoint
 @app.websocket("/ws/{user_id}")
@@ -459,6 +1477,11 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
     connection_id = str(uuid.uuid4())
     await manager.connect(websocket, user_id, connection_id)
     
+    # Dealers are subscribed to the new auction channel for the lifetime of the connection
+    user = await db.users.find_one({"id": user_id}, {"role": 1})
+    if user and user.get("role") == UserRole.DEALER:
+        manager.join_room(connection_id, NEW_AUCTION_CHANNEL)
+    
     try:
         while True:
             data = await websocket.receive_text()
@@ -466,41 +1489,277 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
             
             # Handle different message types
             if message.get("type") == "join_auction":
+                manager.join_room(connection_id, auction_room(message["auction_id"]))
+                await manager.send_personal_message(
+                    encode_event({"type": "joined_auction", "auction_id": message["auction_id"]}),
+                    user_id
+                )
+            elif message.get("type") == "leave_auction":
+                manager.leave_room(connection_id, auction_room(message["auction_id"]))
                 await manager.send_personal_message(
-                    json.dumps({"type": "joined_auction", "auction_id": message["auction_id"]}),
+                    encode_event({"type": "left_auction", "auction_id": message["auction_id"]}),
                     user_id
                 )
             elif message.get("type") == "heartbeat":
                 await manager.send_personal_message(
-                    json.dumps({"type": "heartbeat_response"}),
+                    encode_event({"type": "heartbeat_response"}),
                     user_id
                 )
                 
     except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"WebSocket {connection_id} of user {user_id} closed: {e}")
+    finally:
         manager.disconnect(user_id, connection_id)
 
+# WebSocket delivery of bus events
+async def deliver_new_auction(event: Dict[str, Any]):
+    await manager.broadcast_new_auction(
+        encode_event({"type": "new_auction", "auction": event["auction"]})
+    )
+
+async def deliver_new_bid(event: Dict[str, Any]):
+    await manager.broadcast_to_auction(
+        encode_event({"type": "new_bid", "bid": event["bid"], "auction_id": event["auction_id"]}),
+        event["auction_id"]
+    )
+
+event_bus.subscribe("new_auction", deliver_new_auction)
+event_bus.subscribe("new_bid", deliver_new_bid)
+
+# Auction expiry: a min-heap of (ends_at, auction_id) for active auctions. One task sleeps
+# until the earliest deadline and is woken early when an earlier one is scheduled.
+EXPIRY_RETRY_SECONDS = float(os.environ.get('EXPIRY_RETRY_SECONDS', '5'))
+
+class AuctionExpiryScheduler:
+    def __init__(self):
+        self.heap: List[Tuple[datetime, str]] = []
+        self.deadlines: Dict[str, datetime] = {}
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.closed_auctions = 0
+        
+    async def load(self):
+        cursor = db.car_requests.find(
+            {"status": AuctionStatus.ACTIVE}, {"_id": 0, "id": 1, "ends_at": 1}
+        )
+        async for auction in cursor:
+            self.schedule(auction["id"], auction["ends_at"])
+            
+    def schedule(self, auction_id: str, ends_at: datetime):
+        # Each worker hears about every new auction (locally and through the broker), so
+        # repeated deadlines are ignored; a stale entry only costs a no-op close
+        if self.deadlines.get(auction_id) == ends_at:
+            return
+        self.deadlines[auction_id] = ends_at
+        heapq.heappush(self.heap, (ends_at, auction_id))
+        if self.heap[0][1] == auction_id:
+            self.wakeup.set()
+            
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+        
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+            
+    async def run(self):
+        while True:
+            self.wakeup.clear()
+            if not self.heap:
+                await self.wakeup.wait()
+                continue
+            ends_at, auction_id = self.heap[0]
+            delay = (ends_at - datetime.utcnow()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self.heap)
+            if self.deadlines.get(auction_id) == ends_at:
+                del self.deadlines[auction_id]
+            try:
+                if await close_expired_auction(auction_id):
+                    self.closed_auctions += 1
+            except Exception as e:
+                logger.error(f"Failed to close expired auction {auction_id}: {e}")
+                self.schedule(auction_id, datetime.utcnow() + timedelta(seconds=EXPIRY_RETRY_SECONDS))
+                
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "scheduled_auctions": len(self.deadlines),
+            "next_deadline": self.heap[0][0] if self.heap else None,
+            "closed_auctions": self.closed_auctions,
+        }
+
+expiry_scheduler = AuctionExpiryScheduler()
+
+async def close_expired_auction(auction_id: str) -> bool:
+    # Conditional on the auction still being active and past its deadline, so only one
+    # worker closes it and cancelled or rescheduled auctions are left alone. The winning
+    # bid is already tracked on the auction by every accepted bid.
+    now = datetime.utcnow()
+    auction = await db.car_requests.find_one_and_update(
+        {"id": auction_id, "status": AuctionStatus.ACTIVE, "ends_at": {"$lte": now}},
+        {"$set": {"status": AuctionStatus.CLOSED, "updated_at": now}},
+        projection={"_id": 0, "id": 1, "winning_bid_id": 1, "lowest_price": 1, "bid_count": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if auction is None:
+        return False
+    
+    await increment_counters({
+        f"auctions_{AuctionStatus.ACTIVE.value}": -1,
+        f"auctions_{AuctionStatus.CLOSED.value}": 1
+    })
+    if bid_engine is not None:
+        bid_engine.invalidate(auction_id)
+    invalidate_admin_cache("bids", "auctions")
+    
+    event_bus.publish("auction_closed", {
+        "auction_id": auction_id,
+        "winning_bid_id": auction.get("winning_bid_id"),
+        "lowest_price": auction.get("lowest_price"),
+        "bid_count": auction.get("bid_count", 0),
+        "closed_at": now
+    }, key=auction_id)
+    return True
+
+async def deliver_auction_closed(event: Dict[str, Any]):
+    message = encode_event({"type": "auction_closed", **event})
+    await manager.broadcast_to_auction(message, event["auction_id"])
+    # Dealers browsing the active list drop the auction without having joined its room
+    await manager.broadcast_new_auction(message)
+
+event_bus.subscribe("auction_closed", deliver_auction_closed)
+
+async def _schedule_broadcast_auction(channel: str, message: str):
+    # Auctions created on other workers reach this worker's heap through the broker
+    if channel != NEW_AUCTION_CHANNEL:
+        return
+    event = json.loads(message)
+    if event.get("type") == "new_auction":
+        auction = event["auction"]
+        expiry_scheduler.schedule(auction["id"], datetime.fromisoformat(auction["ends_at"]))
+
+manager.broker.subscribe(_schedule_broadcast_auction)
+
+# Dashboard counters: one document kept current with $inc by every writer and recomputed
+# from source by a periodic reconciliation job, so the dashboard is an O(1) read
+COUNTERS_ID = "dashboard"
+COUNTERS_RECONCILE_SECONDS = float(os.environ.get('COUNTERS_RECONCILE_SECONDS', '600'))
+
+def user_counter_keys(role: str, dealer_tier: Optional[str]) -> List[str]:
+    role = UserRole(role).value
+    keys = ["users_total", f"users_{role}"]
+    if role == UserRole.DEALER.value and dealer_tier:
+        keys.append(f"dealers_{DealerTier(dealer_tier).value}")
+    return keys
+
+async def increment_counters(changes: Dict[str, int]):
+    changes = {key: delta for key, delta in changes.items() if delta}
+    if not changes:
+        return
+    # No upsert: until the document is first reconciled it doesn't exist and is built from source
+    try:
+        await db.counters.update_one({"_id": COUNTERS_ID}, {"$inc": changes})
+    except Exception as e:
+        # Drift is repaired by the next reconciliation, so never fail the caller's request
+        logger.error(f"Failed to update dashboard counters: {e}")
+
+async def reconcile_counters() -> Dict[str, int]:
+    # Drift is corrected as a delta against the counters read just before the source counts,
+    # so increments that land while the counts are computed are kept instead of overwritten
+    # by a $set. A write whose source change and counter $inc straddle the reads can still be
+    # off by one, bounded by the writes in flight during the pass and fixed by the next one.
+    # A delta is only correct once, so the write is guarded on the generation read with the
+    # counters: of overlapping passes (other workers, a first dashboard read) one applies.
+    current = await db.counters.find_one({"_id": COUNTERS_ID}) or {}
+    counts = await compute_dashboard_counts()
+    delta = {key: value - current.get(key, 0) for key, value in counts.items()}
+    delta = {key: change for key, change in delta.items() if change}
+    try:
+        result = await db.counters.update_one(
+            {"_id": COUNTERS_ID, "generation": current.get("generation")},
+            {"$set": {"reconciled_at": datetime.utcnow()}, "$inc": {**delta, "generation": 1}},
+            upsert=not current
+        )
+        applied = result.matched_count > 0 or result.upserted_id is not None
+    except DuplicateKeyError:
+        # Another pass created the document first
+        applied = False
+    if not applied:
+        logger.info("Counter reconciliation skipped, another pass applied first")
+    return counts
+
+async def read_dashboard_counts() -> Dict[str, int]:
+    counters = await db.counters.find_one({"_id": COUNTERS_ID})
+    if counters is None:
+        counters = await reconcile_counters()
+    return counters
+
+async def run_periodically(name: str, interval_seconds: float, job: Callable[[], Awaitable[Any]]):
+    while True:
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Background job {name} failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
 # Dashboard routes
-@api_router.get("/dashboard/stats")
-async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
+async def compute_dashboard_counts() -> Dict[str, int]:
+    # One grouped aggregation per collection, run concurrently: three round trips in total
+    user_groups, auction_groups, total_bids = await asyncio.gather(
+        db.users.aggregate([
+            {"$group": {"_id": {"role": "$role", "tier": "$dealer_tier"}, "count": {"$sum": 1}}}
+        ]).to_list(None),
+        db.car_requests.aggregate([
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ]).to_list(None),
+        db.bids.count_documents({})
+    )
     
-    total_users = await db.users.count_documents({})
-    total_buyers = await db.users.count_documents({"role": "buyer"})
-    total_dealers = await db.users.count_documents({"role": "dealer"})
-    total_auctions = await db.car_requests.count_documents({})
-    active_auctions = await db.car_requests.count_documents({"status": AuctionStatus.ACTIVE})
-    closed_auctions = await db.car_requests.count_documents({"status": AuctionStatus.CLOSED})
-    total_bids = await db.bids.count_documents({})
+    counts = {f"users_{role.value}": 0 for role in UserRole}
+    counts.update({f"dealers_{tier.value}": 0 for tier in DealerTier})
+    counts.update({f"auctions_{auction_status.value}": 0 for auction_status in AuctionStatus})
+    counts["users_total"] = sum(group["count"] for group in user_groups)
+    for group in user_groups:
+        role, tier = group["_id"].get("role"), group["_id"].get("tier")
+        if f"users_{role}" in counts:
+            counts[f"users_{role}"] += group["count"]
+        if role == UserRole.DEALER and f"dealers_{tier}" in counts:
+            counts[f"dealers_{tier}"] += group["count"]
+    counts["auctions_total"] = sum(group["count"] for group in auction_groups)
+    for group in auction_groups:
+        if f"auctions_{group['_id']}" in counts:
+            counts[f"auctions_{group['_id']}"] += group["count"]
+    counts["bids_total"] = total_bids
+    return counts
+
+async def load_dashboard_stats() -> Dict[str, Any]:
+    counts = await read_dashboard_counts()
+    total_users = counts.get("users_total", 0)
+    total_buyers = counts.get("users_buyer", 0)
+    total_dealers = counts.get("users_dealer", 0)
+    total_auctions = counts.get("auctions_total", 0)
+    active_auctions = counts.get("auctions_active", 0)
+    closed_auctions = counts.get("auctions_closed", 0)
+    total_bids = counts.get("bids_total", 0)
     
     # Calculate revenue (simplified - $20 per completed auction + dealer fees)
-    completed_auctions = await db.car_requests.count_documents({"status": AuctionStatus.CLOSED})
-    buyer_fees = completed_auctions * 20  # $20 per auction
+    buyer_fees = closed_auctions * 20  # $20 per completed auction
     
     # Dealer subscription revenue (estimated)
-    standard_dealers = await db.users.count_documents({"role": "dealer", "dealer_tier": "standard"})
-    premium_dealers = await db.users.count_documents({"role": "dealer", "dealer_tier": "premium"})
-    gold_dealers = await db.users.count_documents({"role": "dealer", "dealer_tier": "gold"})
+    standard_dealers = counts.get("dealers_standard", 0)
+    premium_dealers = counts.get("dealers_premium", 0)
+    gold_dealers = counts.get("dealers_gold", 0)
     
     monthly_revenue = (standard_dealers * 250) + (premium_dealers * 350) + (gold_dealers * 500)
     total_revenue = buyer_fees + monthly_revenue
@@ -518,13 +1777,21 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
         "buyer_fees": buyer_fees
     }
 
-# Admin User Management
-@api_router.get("/admin/users")
-async def get_all_users(current_user: User = Depends(get_current_user)):
+@api_router.get("/dashboard/stats")
+async def get_dashboard_stats(request: Request, current_user: TokenClaims = Depends(get_token_claims)):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    users = await db.users.find({}, {"password": 0}).to_list(1000)  # Exclude passwords
+    async def build():
+        return await load_dashboard_stats(), None
+    
+    return await cached_response(request, ["users", "auctions", "bids"], build)
+
+# Admin User Management
+async def load_admin_users(limit: int, after: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+    users, next_cursor = await fetch_page(
+        db.users, {}, "created_at", DESCENDING, limit, after, projection={"password": 0}  # Exclude passwords
+    )
     
     # Convert ObjectId to string and clean up data
     for user in users:
@@ -536,7 +1803,19 @@ async def get_all_users(current_user: User = Depends(get_current_user)):
         if "updated_at" in user and user["updated_at"]:
             user["updated_at"] = user["updated_at"].isoformat()
     
-    return users
+    return users, next_cursor
+
+@api_router.get("/admin/users")
+async def get_all_users(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await cached_response(request, ["users"], lambda: load_admin_users(limit, after))
 
 @api_router.put("/admin/users/{user_id}")
 async def update_user(user_id: str, update_data: UserUpdate, current_user: User = Depends(get_current_user)):
@@ -572,9 +1851,23 @@ async def update_user(user_id: str, update_data: UserUpdate, current_user: User
     if update_fields:
         update_fields["updated_at"] = datetime.utcnow()
         
-        result = await db.users.update_one({"id": user_id}, {"$set": update_fields})
-        if result.modified_count == 0:
+        previous = await db.users.find_one_and_update(
+            {"id": user_id},
+            user_update_operation(update_fields),
+            projection={"role": 1, "dealer_tier": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if previous is None:
             raise HTTPException(status_code=404, detail="User not found")
+        await invalidate_user(user_id)
+        
+        if "dealer_tier" in update_fields:
+            changes: Dict[str, int] = {}
+            for key in user_counter_keys(previous["role"], previous.get("dealer_tier")):
+                changes[key] = changes.get(key, 0) - 1
+            for key in user_counter_keys(previous["role"], update_fields["dealer_tier"]):
+                changes[key] = changes.get(key, 0) + 1
+            await increment_counters(changes)
     
     return {"message": "User updated successfully"}
 
@@ -586,11 +1879,12 @@ async def verify_dealer_license(user_id: str, current_user: User = Depends(get_c
     
     result = await db.users.update_one(
         {"id": user_id, "role": "dealer"},
-        {"$set": {"license_verified": True, "updated_at": datetime.utcnow()}}
+        user_update_operation({"license_verified": True, "updated_at": datetime.utcnow()})
     )
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Dealer not found")
+    await invalidate_user(user_id)
     
     return {"message": "Dealer license verified successfully"}
 
@@ -603,20 +1897,23 @@ async def delete_user(user_id: str, current_user: User = Depends(get_current_use
     if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete your own account")
     
-    result = await db.users.delete_one({"id": user_id})
-    if result.deleted_count == 0:
+    deleted = await db.users.find_one_and_delete({"id": user_id}, projection={"role": 1, "dealer_tier": 1})
+    if deleted is None:
         raise HTTPException(status_code=404, detail="User not found")
+    await invalidate_user(user_id)
+    await increment_counters({key: -1 for key in user_counter_keys(deleted["role"], deleted.get("dealer_tier"))})
     
     return {"message": "User deleted successfully"}
 
 # Admin Auction Management
-@api_router.get("/admin/auctions")
-async def get_all_auctions(current_user: User = Depends(get_current_user)):
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+async def load_admin_auctions(limit: int, after: Optional[str]) -> Tuple[List[dict], Optional[str]]:
     # Get all auctions with buyer information
-    auctions = await db.car_requests.find({}).to_list(1000)
+    auctions, next_cursor = await fetch_page(db.car_requests, {}, "created_at", DESCENDING, limit, after)
+    
+    # Fetch every buyer referenced by the page in one query
+    buyer_ids = list({auction.get("buyer_id") for auction in auctions})
+    buyers = await db.users.find({"id": {"$in": buyer_ids}}, {"password": 0}).to_list(None)
+    buyers_by_id = {buyer["id"]: buyer for buyer in buyers}
     
     # Enrich with buyer and bid information
     for auction in auctions:
@@ -624,17 +1921,16 @@ async def get_all_auctions(current_user: User = Depends(get_current_user)):
             auction["_id"] = str(auction["_id"])
         
         # Get buyer info
-        buyer = await db.users.find_one({"id": auction.get("buyer_id")}, {"password": 0})
+        buyer = buyers_by_id.get(auction.get("buyer_id"))
         if buyer:
             if "_id" in buyer:
                 buyer["_id"] = str(buyer["_id"])
             auction["buyer"] = buyer
         
-        # Get bid count and lowest bid
-        bids = await db.bids.find({"auction_id": auction.get("id")}).to_list(1000)
-        auction["bid_count"] = len(bids)
-        if bids:
-            auction["lowest_bid"] = min(bid["price"] for bid in bids)
+        # Bid count and lowest bid are maintained on the auction by create_bid
+        auction["bid_count"] = auction.get("bid_count", 0)
+        if auction.get("lowest_price") is not None:
+            auction["lowest_bid"] = auction["lowest_price"]
         
         # Format dates
         if "created_at" in auction and auction["created_at"]:
@@ -644,7 +1940,19 @@ async def get_all_auctions(current_user: User = Depends(get_current_user)):
         if "ends_at" in auction and auction["ends_at"]:
             auction["ends_at"] = auction["ends_at"].isoformat()
     
-    return auctions
+    return auctions, next_cursor
+
+@api_router.get("/admin/auctions")
+async def get_all_auctions(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await cached_response(request, ["auctions", "users", "bids"], lambda: load_admin_auctions(limit, after))
 
 @api_router.put("/admin/auctions/{auction_id}/status")
 async def update_auction_status(auction_id: str, status_data: dict, current_user: User = Depends(get_current_user)):
@@ -655,24 +1963,72 @@ async def update_auction_status(auction_id: str, status_data: dict, current_user
     if new_status not in [AuctionStatus.ACTIVE, AuctionStatus.CLOSED, AuctionStatus.CANCELLED]:
         raise HTTPException(status_code=400, detail="Invalid status")
     
-    result = await db.car_requests.update_one(
-        {"id": auction_id},
-        {"$set": {"status": new_status, "updated_at": datetime.utcnow()}}
+    now = datetime.utcnow()
+    query = {"id": auction_id}
+    update = {"status": new_status, "updated_at": now}
+    if new_status == AuctionStatus.ACTIVE:
+        # An active auction past its deadline would never be closed: reactivating one needs
+        # a new deadline, otherwise the current one must still be ahead
+        if status_data.get("ends_at") is not None:
+            try:
+                ends_at = datetime.fromisoformat(status_data["ends_at"])
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid ends_at")
+            if ends_at.tzinfo is not None:
+                ends_at = ends_at.astimezone(timezone.utc).replace(tzinfo=None)
+            if ends_at <= now:
+                raise HTTPException(status_code=400, detail="ends_at must be in the future")
+            update["ends_at"] = ends_at
+        else:
+            query["ends_at"] = {"$gt": now}
+    
+    previous = await db.car_requests.find_one_and_update(
+        query,
+        {"$set": update},
+        projection={"status": 1, "ends_at": 1},
+        return_document=ReturnDocument.BEFORE
     )
     
-    if result.modified_count == 0:
+    if previous is None and "ends_at" in query:
+        if await db.car_requests.find_one({"id": auction_id}, {"_id": 1}) is not None:
+            raise HTTPException(status_code=400, detail="Auction has ended; provide a new ends_at to reactivate it")
+    
+    if previous is None:
         raise HTTPException(status_code=404, detail="Auction not found")
     
+    if previous["status"] != new_status:
+        await increment_counters({
+            f"auctions_{AuctionStatus(previous['status']).value}": -1,
+            f"auctions_{AuctionStatus(new_status).value}": 1
+        })
+    
+    if bid_engine is not None:
+        bid_engine.invalidate(auction_id)
+    if new_status == AuctionStatus.ACTIVE:
+        expiry_scheduler.schedule(auction_id, update.get("ends_at", previous["ends_at"]))
+    invalidate_admin_cache("auctions")
+    
     return {"message": f"Auction status updated to {new_status}"}
 
 # Admin Bid Management
-@api_router.get("/admin/bids")
-async def get_all_bids(current_user: User = Depends(get_current_user)):
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+ADMIN_BID_AUCTION_PROJECTION = {
+    "_id": 0, "id": 1, "title": 1, "make": 1, "model": 1, "year": 1, "status": 1, "winning_bid_id": 1
+}
+ADMIN_BID_DEALER_PROJECTION = {"_id": 0, "id": 1, "name": 1, "email": 1, "dealer_tier": 1}
+
+async def load_admin_bids(limit: int, after: Optional[str]) -> Tuple[List[dict], Optional[str]]:
     # Get all bids
-    bids = await db.bids.find({}).sort("created_at", -1).to_list(1000)
+    bids, next_cursor = await fetch_page(db.bids, {}, "created_at", DESCENDING, limit, after)
+    
+    # Fetch the referenced auctions and dealers once each, projected to what the admin UI shows
+    auction_ids = list({bid.get("auction_id") for bid in bids})
+    dealer_ids = list({bid.get("dealer_id") for bid in bids})
+    auctions, dealers = await asyncio.gather(
+        db.car_requests.find({"id": {"$in": auction_ids}}, ADMIN_BID_AUCTION_PROJECTION).to_list(None),
+        db.users.find({"id": {"$in": dealer_ids}}, ADMIN_BID_DEALER_PROJECTION).to_list(None)
+    )
+    auctions_by_id = {auction["id"]: auction for auction in auctions}
+    dealers_by_id = {dealer["id"]: dealer for dealer in dealers}
     
     # Enrich with auction and dealer information
     for bid in bids:
@@ -680,154 +2036,251 @@ async def get_all_bids(current_user: User = Depends(get_current_user)):
             bid["_id"] = str(bid["_id"])
         
         # Get auction info
-        auction = await db.car_requests.find_one({"id": bid.get("auction_id")})
+        auction = auctions_by_id.get(bid.get("auction_id"))
         if auction:
-            if "_id" in auction:
-                auction["_id"] = str(auction["_id"])
             bid["auction"] = auction
+            apply_bid_status(bid, auction.get("winning_bid_id"))
         
         # Get dealer info
-        dealer = await db.users.find_one({"id": bid.get("dealer_id")}, {"password": 0})
+        dealer = dealers_by_id.get(bid.get("dealer_id"))
         if dealer:
-            if "_id" in dealer:
-                dealer["_id"] = str(dealer["_id"])
             bid["dealer"] = dealer
         
         # Format dates
         if "created_at" in bid and bid["created_at"]:
             bid["created_at"] = bid["created_at"].isoformat()
     
-    return bids
+    return bids, next_cursor
 
-# Admin Analytics
-@api_router.get("/admin/analytics")
-async def get_analytics(current_user: User = Depends(get_current_user)):
+@api_router.get("/admin/bids")
+async def get_all_bids(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Daily auction creation stats (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    
-    auction_pipeline = [
-        {
-            "$match": {
-                "created_at": {"$gte": thirty_days_ago}
-            }
-        },
-        {
-            "$group": {
-                "_id": {
-                    "$dateToString": {
-                        "format": "%Y-%m-%d",
-                        "date": "$created_at"
-                    }
-                },
-                "count": {"$sum": 1}
-            }
-        },
-        {
-            "$sort": {"_id": 1}
-        }
-    ]
+    return await cached_response(request, ["bids", "auctions", "users"], lambda: load_admin_bids(limit, after))
+
+# Admin Data Export
+# Streams a whole collection as NDJSON or CSV straight from a Motor cursor, so memory stays
+# constant regardless of collection size. Only the listed fields are ever read.
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', '1000'))
+
+async def _derive_export_bid_status(bids: List[dict]):
+    auction_ids = list({bid["auction_id"] for bid in bids})
+    auctions = await db.car_requests.find(
+        {"id": {"$in": auction_ids}}, {"id": 1, "winning_bid_id": 1}
+    ).to_list(None)
+    winning_bid_ids = {auction["id"]: auction.get("winning_bid_id") for auction in auctions}
+    for bid in bids:
+        apply_bid_status(bid, winning_bid_ids.get(bid["auction_id"]))
+
+EXPORTS: Dict[str, Dict[str, Any]] = {
+    "users": {
+        "collection": "users",
+        "fields": [
+            "id", "email", "name", "role", "dealer_tier", "phone", "location", "dealer_license",
+            "license_verified", "is_verified", "is_active", "created_at", "updated_at"
+        ],
+        "filters": {"role"},
+    },
+    "car-requests": {
+        "collection": "car_requests",
+        "fields": [
+            "id", "buyer_id", "title", "make", "model", "year", "max_budget", "location", "status",
+            "created_at", "ends_at", "winning_bid_id", "lowest_price", "bid_count"
+        ],
+        "filters": {"status", "buyer_id"},
+    },
+    "bids": {
+        "collection": "bids",
+        "fields": ["id", "auction_id", "dealer_id", "dealer_name", "dealer_tier", "price", "status", "created_at"],
+        "filters": {"auction_id", "dealer_id"},
+        "prepare": _derive_export_bid_status,
+    },
+}
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+def _format_export_rows(rows: List[dict], fields: List[str], export_format: str) -> str:
+    if export_format == "ndjson":
+        return "".join(encode_event({field: row.get(field) for field in fields}) + "\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_export_value(row.get(field)) for field in fields] for row in rows)
+    return buffer.getvalue()
+
+async def _stream_export(export: Dict[str, Any], query: dict, export_format: str):
+    fields = export["fields"]
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fields)
+        yield buffer.getvalue()
+    
+    projection = {field: 1 for field in fields}
+    projection["_id"] = 0
+    cursor = db[export["collection"]].find(query, projection).batch_size(EXPORT_BATCH_SIZE)
+    rows = []
+    async for row in cursor:
+        rows.append(row)
+        if len(rows) >= EXPORT_BATCH_SIZE:
+            if "prepare" in export:
+                await export["prepare"](rows)
+            yield _format_export_rows(rows, fields, export_format)
+            rows = []
+    if rows:
+        if "prepare" in export:
+            await export["prepare"](rows)
+        yield _format_export_rows(rows, fields, export_format)
+
+@api_router.get("/admin/export/{dataset}")
+async def export_data(
+    dataset: str,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    auction_status: Optional[str] = Query(None, alias="status"),
+    role: Optional[str] = None,
+    buyer_id: Optional[str] = None,
+    auction_id: Optional[str] = None,
+    dealer_id: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
     
-    daily_auctions = await db.car_requests.aggregate(auction_pipeline).to_list(30)
+    export = EXPORTS.get(dataset)
+    if export is None:
+        raise HTTPException(status_code=404, detail="Unknown export")
     
-    # Bid activity stats
-    bid_pipeline = [
-        {
-            "$match": {
-                "created_at": {"$gte": thirty_days_ago}
-            }
-        },
-        {
-            "$group": {
-                "_id": {
-                    "$dateToString": {
-                        "format": "%Y-%m-%d",
-                        "date": "$created_at"
-                    }
-                },
-                "count": {"$sum": 1}
-            }
-        },
-        {
-            "$sort": {"_id": 1}
-        }
-    ]
-    
-    daily_bids = await db.bids.aggregate(bid_pipeline).to_list(30)
+    # Build the server-side filter from the parameters this dataset supports
+    filters = {
+        "status": auction_status, "role": role, "buyer_id": buyer_id, "auction_id": auction_id, "dealer_id": dealer_id
+    }
+    query = {}
+    for field, value in filters.items():
+        if value is None:
+            continue
+        if field not in export["filters"]:
+            raise HTTPException(status_code=400, detail=f"Filter '{field}' is not supported for {dataset}")
+        query[field] = value
+    if created_from or created_to:
+        query["created_at"] = {}
+        if created_from:
+            query["created_at"]["$gte"] = created_from
+        if created_to:
+            query["created_at"]["$lt"] = created_to
+    
+    media_type = "application/x-ndjson" if export_format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        _stream_export(export, query, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{export_format}"'}
+    )
+
+# Analytics rollups: per-day auction/bid/registration counts live in daily_stats, kept
+# current with $inc by the writers and recomputed from source by a background job. The
+# top-auctions leaderboard is read off the car_requests (bid_count, id) index.
+ANALYTICS_DAYS = 30
+DAILY_STATS_RECOMPUTE_SECONDS = float(os.environ.get('DAILY_STATS_RECOMPUTE_SECONDS', '3600'))
+TOP_AUCTIONS_LIMIT = 10
+TOP_AUCTION_PROJECTION = {
+    "_id": 0, "id": 1, "title": 1, "make": 1, "model": 1, "year": 1, "status": 1,
+    "max_budget": 1, "created_at": 1, "ends_at": 1, "bid_count": 1, "lowest_price": 1
+}
+
+def day_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d")
+
+async def record_daily_stats(changes: Dict[str, int], moment: Optional[datetime] = None):
+    changes = {key: delta for key, delta in changes.items() if delta}
+    if not changes:
+        return
+    try:
+        await db.daily_stats.update_one(
+            {"_id": day_key(moment or datetime.utcnow())}, {"$inc": changes}, upsert=True
+        )
+    except Exception as e:
+        # The next recompute restores the day, so never fail the caller's request
+        logger.error(f"Failed to update daily stats: {e}")
+
+async def recompute_daily_stats():
+    # Rebuild the closed days of the analytics window from source; also serves as the
+    # backfill. Today is left to record_daily_stats: a $set computed from a read could
+    # overwrite increments that land between the read and the write.
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    first_day = today - timedelta(days=ANALYTICS_DAYS - 1)
+    
+    def daily_pipeline(extra_group_key: Optional[str] = None) -> List[dict]:
+        group_id = {"date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}}
+        if extra_group_key:
+            group_id[extra_group_key] = f"${extra_group_key}"
+        return [
+            {"$match": {"created_at": {"$gte": first_day, "$lt": today}}},
+            {"$group": {"_id": group_id, "count": {"$sum": 1}}}
+        ]
+    
+    daily_auctions, daily_bids, daily_registrations = await asyncio.gather(
+        db.car_requests.aggregate(daily_pipeline()).to_list(None),
+        db.bids.aggregate(daily_pipeline()).to_list(None),
+        db.users.aggregate(daily_pipeline("role")).to_list(None)
+    )
     
-    # User registration stats
-    user_pipeline = [
-        {
-            "$match": {
-                "created_at": {"$gte": thirty_days_ago}
-            }
-        },
-        {
-            "$group": {
-                "_id": {
-                    "date": {
-                        "$dateToString": {
-                            "format": "%Y-%m-%d",
-                            "date": "$created_at"
-                        }
-                    },
-                    "role": "$role"
-                },
-                "count": {"$sum": 1}
-            }
-        },
-        {
-            "$sort": {"_id.date": 1}
-        }
-    ]
+    days: Dict[str, Dict[str, Any]] = {}
     
-    daily_registrations = await db.users.aggregate(user_pipeline).to_list(100)
+    def day(group: dict) -> Dict[str, Any]:
+        return days.setdefault(group["_id"]["date"], {"auctions": 0, "bids": 0, "registrations": {}})
     
-    # Top performing auctions
-    top_auctions_pipeline = [
-        {
-            "$lookup": {
-                "from": "bids",
-                "localField": "id",
-                "foreignField": "auction_id",
-                "as": "bids"
-            }
-        },
-        {
-            "$addFields": {
-                "bid_count": {"$size": "$bids"},
-                "lowest_bid": {"$min": "$bids.price"}
-            }
-        },
-        {
-            "$sort": {"bid_count": -1}
-        },
-        {
-            "$limit": 10
-        }
-    ]
+    for group in daily_auctions:
+        day(group)["auctions"] = group["count"]
+    for group in daily_bids:
+        day(group)["bids"] = group["count"]
+    for group in daily_registrations:
+        day(group)["registrations"][group["_id"]["role"]] = group["count"]
     
-    top_auctions = await db.car_requests.aggregate(top_auctions_pipeline).to_list(10)
+    for key, fields in days.items():
+        await db.daily_stats.update_one({"_id": key}, {"$set": fields}, upsert=True)
+
+async def load_top_auctions() -> List[dict]:
+    # Read straight off the bid_count index: ten auction summaries, whatever the bid volume
+    top_auctions = await db.car_requests.find(
+        {"bid_count": {"$gt": 0}}, TOP_AUCTION_PROJECTION
+    ).sort([("bid_count", DESCENDING), ("id", ASCENDING)]).limit(TOP_AUCTIONS_LIMIT).to_list(TOP_AUCTIONS_LIMIT)
     
-    # Clean up ObjectId serialization issues
     for auction in top_auctions:
-        if "_id" in auction:
-            auction["_id"] = str(auction["_id"])
+        auction["lowest_bid"] = auction.pop("lowest_price", None)
         if "created_at" in auction and auction["created_at"]:
             auction["created_at"] = auction["created_at"].isoformat()
-        if "updated_at" in auction and auction["updated_at"]:
-            auction["updated_at"] = auction["updated_at"].isoformat()
         if "ends_at" in auction and auction["ends_at"]:
             auction["ends_at"] = auction["ends_at"].isoformat()
-        # Clean up bids array
-        if "bids" in auction:
-            for bid in auction["bids"]:
-                if "_id" in bid:
-                    bid["_id"] = str(bid["_id"])
-                if "created_at" in bid and bid["created_at"]:
-                    bid["created_at"] = bid["created_at"].isoformat()
+    return top_auctions
+
+# Admin Analytics
+async def load_analytics() -> Dict[str, Any]:
+    # Daily stats for the last 30 days plus the leaderboard: at most 40 small documents
+    now = datetime.utcnow()
+    window = {"_id": {"$gte": day_key(now - timedelta(days=ANALYTICS_DAYS - 1)), "$lte": day_key(now)}}
+    days, top_auctions = await asyncio.gather(
+        db.daily_stats.find(window).sort("_id", ASCENDING).to_list(ANALYTICS_DAYS),
+        load_top_auctions()
+    )
+    
+    daily_auctions = [{"_id": day["_id"], "count": day["auctions"]} for day in days if day.get("auctions")]
+    daily_bids = [{"_id": day["_id"], "count": day["bids"]} for day in days if day.get("bids")]
+    daily_registrations = [
+        {"_id": {"date": day["_id"], "role": role}, "count": count}
+        for day in days
+        for role, count in sorted(day.get("registrations", {}).items())
+        if count
+    ]
     
     return {
         "daily_auctions": daily_auctions,
@@ -836,12 +2289,18 @@ async def get_analytics(current_user: User = Depends(get_current_user)):
         "top_auctions": top_auctions
     }
 
-# System Health Check
-@api_router.get("/admin/system/health")
-async def system_health_check(current_user: User = Depends(get_current_user)):
+@api_router.get("/admin/analytics")
+async def get_analytics(request: Request, current_user: TokenClaims = Depends(get_token_claims)):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required")
     
+    async def build():
+        return await load_analytics(), None
+    
+    return await cached_response(request, ["users", "auctions", "bids"], build)
+
+# System Health Check
+async def load_system_health() -> Dict[str, Any]:
     try:
         # Test database connection
         await db.users.find_one()
@@ -855,10 +2314,75 @@ async def system_health_check(current_user: User = Depends(get_current_user)):
     return {
         "database": db_status,
         "websocket_connections": active_connections,
+        "websocket_rooms": manager.room_stats(),
+        "websocket_queues": manager.queue_stats(),
+        "websocket_broker": {"backend": type(manager.broker).__name__, "node_id": NODE_ID},
+        "event_bus": event_bus.stats(),
+        "password_pool": password_pool.stats(),
+        "user_cache": user_cache.stats(),
+        "token_version_cache": token_versions.stats(),
+        "admin_response_cache": response_cache.stats(),
+        "bid_engine": bid_engine.stats() if bid_engine is not None else None,
+        "bid_writer": bid_writer.stats(),
+        "auction_expiry": expiry_scheduler.stats(),
         "timestamp": datetime.utcnow(),
         "status": "healthy" if db_status == "healthy" else "error"
     }
 
+@api_router.get("/admin/system/health")
+async def system_health_check(current_user: TokenClaims = Depends(get_token_claims)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await load_system_health()
+
+# Admin Overview
+# Everything the admin dashboard shows, in one request: one user resolution and all
+# sections loaded concurrently. Each list section is paginated independently and defaults
+# to a short preview; the dashboard asks for the list on screen at full page size.
+OVERVIEW_PAGE_SIZE = int(os.environ.get('OVERVIEW_PAGE_SIZE', '20'))
+
+@api_router.get("/admin/overview")
+async def get_admin_overview(
+    request: Request,
+    users_limit: int = Query(OVERVIEW_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    users_after: Optional[str] = None,
+    auctions_limit: int = Query(OVERVIEW_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    auctions_after: Optional[str] = None,
+    bids_limit: int = Query(OVERVIEW_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    bids_after: Optional[str] = None,
+    current_user: TokenClaims = Depends(get_token_claims)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    async def build():
+        stats, users_page, auctions_page, bids_page, analytics = await asyncio.gather(
+            load_dashboard_stats(),
+            load_admin_users(users_limit, users_after),
+            load_admin_auctions(auctions_limit, auctions_after),
+            load_admin_bids(bids_limit, bids_after),
+            load_analytics()
+        )
+        return {
+            "stats": stats,
+            "users": {"items": users_page[0], "next_cursor": users_page[1]},
+            "auctions": {"items": auctions_page[0], "next_cursor": auctions_page[1]},
+            "bids": {"items": bids_page[0], "next_cursor": bids_page[1]},
+            "analytics": analytics
+        }, None
+    
+    # Data sections are cached like the section endpoints; health is checked on every request
+    # and spliced into the cached body, so there is no ETag for the response as a whole
+    (body, _, headers), health = await asyncio.gather(
+        cached_body(request, ["users", "auctions", "bids"], build),
+        load_system_health()
+    )
+    body = body[:-1] + b',"health":' + encode_event(health).encode('utf-8') + b'}'
+    return Response(
+        content=body, media_type="application/json", headers={**headers, "Cache-Control": "no-store"}
+    )
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -868,6 +2392,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # Configure logging
@@ -877,6 +2402,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+background_tasks: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_background_services():
+    await ensure_indexes()
+    await run_once("bid_summaries", backfill_bid_summaries)
+    await manager.broker.start()
+    event_bus.start()
+    await expiry_scheduler.load()
+    expiry_scheduler.start()
+    background_tasks.append(asyncio.create_task(
+        run_periodically("counter reconciliation", COUNTERS_RECONCILE_SECONDS, reconcile_counters)
+    ))
+    background_tasks.append(asyncio.create_task(
+        run_periodically("daily stats recompute", DAILY_STATS_RECOMPUTE_SECONDS, recompute_daily_stats)
+    ))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await expiry_scheduler.stop()
+    if bid_engine is not None:
+        await bid_engine.stop()
+    await bid_writer.close()
+    await event_bus.stop()
+    await manager.broker.stop()
+    password_pool.executor.shutdown(wait=False)
     client.close()
\ No newline at end of file
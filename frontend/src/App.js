@@ -1725,6 +1725,14 @@ const BidForm = ({ auction, onSubmit, onCancel }) => {
 };
 
 // Admin Dashboard Component
+// The overview returns a short preview of every list; the list on screen is requested in full
+const ADMIN_SECTION_LIMITS = {
+  'all-users': 'users_limit',
+  'all-auctions': 'auctions_limit',
+  'all-bids': 'bids_limit',
+};
+const ADMIN_LIST_PAGE_SIZE = 1000;
+
 const AdminDashboard = ({ activeSection }) => {
   const [adminStats, setAdminStats] = useState(null);
   const [allUsers, setAllUsers] = useState([]);
@@ -1743,33 +1751,17 @@ const AdminDashboard = ({ activeSection }) => {
   const fetchAdminData = async () => {
     setLoading(true);
     try {
-      // Fetch stats
-      const statsRes = await axios.get(`${API}/dashboard/stats`);
-      setAdminStats(statsRes.data);
-
-      // Fetch data based on active section
-      switch (activeSection) {
-        case 'all-users':
-          const usersRes = await axios.get(`${API}/admin/users`);
-          setAllUsers(usersRes.data);
-          break;
-        case 'all-auctions':
-          const auctionsRes = await axios.get(`${API}/admin/auctions`);
-          setAllAuctions(auctionsRes.data);
-          break;
-        case 'all-bids':
-          const bidsRes = await axios.get(`${API}/admin/bids`);
-          setAllBids(bidsRes.data);
-          break;
-        case 'analytics':
-          const analyticsRes = await axios.get(`${API}/admin/analytics`);
-          setAnalytics(analyticsRes.data);
-          break;
-        case 'system':
-          const healthRes = await axios.get(`${API}/admin/system/health`);
-          setSystemHealth(healthRes.data);
-          break;
-      }
+      // Fetch every admin section in a single, server-cached request
+      const limitParam = ADMIN_SECTION_LIMITS[activeSection];
+      const params = limitParam ? { [limitParam]: ADMIN_LIST_PAGE_SIZE } : {};
+      const overviewRes = await axios.get(`${API}/admin/overview`, { params });
+      const overview = overviewRes.data;
+      setAdminStats(overview.stats);
+      setAllUsers(overview.users.items);
+      setAllAuctions(overview.auctions.items);
+      setAllBids(overview.bids.items);
+      setAnalytics(overview.analytics);
+      setSystemHealth(overview.health);
     } catch (error) {
       console.error('Error fetching admin data:', error);
     } finally {
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+from pymongo import MongoClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Never run against the database configured in backend/.env
+os.environ["DB_NAME"] = os.environ.get("TEST_DB_NAME", "carbidx_test")
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+
+import server  # noqa: E402
+from tests.support import FakeWebSocket  # noqa: E402
+
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS") == "1"
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing runs, enabled with RUN_BENCHMARKS=1")
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def loop():
+    # One loop for the whole session: the Motor client in server.py is created at import
+    loop = asyncio.new_event_loop()
+    yield loop
+
+    async def cancel_pending():
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    loop.run_until_complete(cancel_pending())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(loop):
+    return loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def mongo_available():
+    try:
+        MongoClient(os.environ["MONGO_URL"], serverSelectionTimeoutMS=2000).admin.command("ping")
+    except Exception as e:
+        pytest.skip(f"MongoDB not reachable at {os.environ['MONGO_URL']}: {e}")
+
+
+@pytest.fixture
+def db(run, mongo_available):
+    # A fresh database with the production index registry applied
+    async def reset():
+        await server.client.drop_database(server.db.name)
+        await server.ensure_indexes()
+
+    run(reset())
+    yield server.db
+    run(server.client.drop_database(server.db.name))
+
+
+@pytest.fixture
+def ws_manager(run):
+    manager = server.ConnectionManager(server.InMemoryBroker())
+    yield manager
+
+    async def close():
+        for connection in list(manager.active_connections.values()):
+            manager.disconnect(connection.user_id, connection.connection_id)
+        await asyncio.sleep(0)
+
+    run(close())
+
+
+@pytest.fixture
+def connect_clients():
+    async def connect(manager, count: int, room: str) -> List[FakeWebSocket]:
+        sockets = []
+        for index in range(count):
+            websocket = FakeWebSocket()
+            connection_id = f"{room}-{index}"
+            await manager.connect(websocket, f"user-{index}", connection_id)
+            manager.join_room(connection_id, room)
+            sockets.append(websocket)
+        return sockets
+
+    return connect
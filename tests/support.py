@@ -0,0 +1,56 @@
+import asyncio
+from typing import List
+
+import server
+
+
+class FakeWebSocket:
+    # Stands in for a connected client: frames are recorded instead of written to a socket
+    def __init__(self):
+        self.frames: List[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.frames.append(message)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def drain(manager):
+    # Wait until every writer task has emptied its outbound queue
+    while any(connection.queue.qsize() for connection in manager.active_connections.values()):
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def make_auction(**fields) -> "server.CarRequest":
+    defaults = {
+        "buyer_id": "buyer-1",
+        "title": "Family SUV",
+        "make": "Toyota",
+        "model": "RAV4",
+        "year": 2023,
+        "max_budget": 50000,
+        "description": "Hybrid, low mileage",
+        "location": "Austin, TX",
+    }
+    return server.CarRequest(**{**defaults, **fields})
+
+
+def make_bid(auction_id: str, price: float, dealer: int = 1) -> "server.Bid":
+    return server.Bid(
+        auction_id=auction_id,
+        dealer_id=f"dealer-{dealer}",
+        dealer_name=f"Dealer {dealer}",
+        dealer_tier=server.DealerTier.STANDARD,
+        price=price,
+        status=server.BidStatus.WINNING,
+    )
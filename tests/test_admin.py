@@ -0,0 +1,217 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from starlette.requests import Request
+
+import server
+from tests.support import make_auction, make_bid
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        self.commands.append(event.command_name)
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def round_trips(self, name: str) -> int:
+        return self.commands.count(name)
+
+
+@pytest.fixture
+def counter(db, monkeypatch):
+    # server.db is swapped for the same database behind a client that records every command
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"], event_listeners=[counter])
+    monkeypatch.setattr(server, "db", client[db.name])
+    yield counter
+    client.close()
+
+
+async def seed_marketplace(db, auctions: int, bids_per_auction: int = 3):
+    now = datetime.utcnow()
+    documents, bids = [], []
+    for n in range(auctions):
+        auction = make_auction(buyer_id=f"buyer-{n % 50}", created_at=now - timedelta(seconds=n))
+        auction_bids = [
+            {**make_bid(auction.id, 40000 - step, dealer=step).dict(), "created_at": now - timedelta(seconds=n, milliseconds=step)}
+            for step in range(bids_per_auction)
+        ]
+        if auction_bids:
+            auction.lowest_price = auction_bids[-1]["price"]
+            auction.winning_bid_id = auction_bids[-1]["id"]
+            auction.bid_count = bids_per_auction
+        documents.append(auction.dict())
+        bids.extend(auction_bids)
+    await db.users.insert_many([
+        {"id": f"buyer-{n}", "email": f"buyer-{n}@example.com", "name": f"Buyer {n}", "role": "buyer", "created_at": now}
+        for n in range(50)
+    ] + [
+        {"id": f"dealer-{n}", "email": f"dealer-{n}@example.com", "name": f"Dealer {n}", "role": "dealer", "created_at": now}
+        for n in range(bids_per_auction)
+    ])
+    await db.car_requests.insert_many(documents)
+    if bids:
+        await db.bids.insert_many(bids)
+
+
+@pytest.mark.parametrize("auctions", [10, 200, 1_000])
+def test_admin_lists_use_a_constant_number_of_queries(run, db, counter, auctions):
+    run(seed_marketplace(db, auctions))
+    counter.commands.clear()
+
+    started = time.perf_counter()
+    page, _ = run(server.load_admin_auctions(server.MAX_PAGE_SIZE, None))
+    auctions_elapsed = time.perf_counter() - started
+    auction_finds = counter.round_trips("find")
+    counter.commands.clear()
+
+    started = time.perf_counter()
+    bids, _ = run(server.load_admin_bids(server.MAX_PAGE_SIZE, None))
+    bids_elapsed = time.perf_counter() - started
+
+    print(
+        f"\n{auctions} auctions: admin auctions {auction_finds} finds in {auctions_elapsed * 1e3:.1f}ms, "
+        f"admin bids {counter.round_trips('find')} finds in {bids_elapsed * 1e3:.1f}ms"
+    )
+    assert len(page) == auctions
+    assert all((auction["bid_count"], auction["lowest_bid"]) == (3, 39998) for auction in page)
+    # One page query plus one batched lookup per referenced collection, whatever the page size
+    assert auction_finds == 2
+    assert counter.round_trips("find") == 3
+    assert len(bids) == min(server.MAX_PAGE_SIZE, auctions * 3)
+
+
+ADMIN = server.TokenClaims(**server.build_token_claims({"email": "admin@example.com", "id": "admin-1", "role": "admin"}))
+
+
+def overview_request(etag: Optional[str] = None) -> Request:
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "path": "/api/admin/overview", "query_string": b"", "headers": headers})
+
+
+def test_overview_is_served_from_the_admin_cache(run, db, counter):
+    run(seed_marketplace(db, 60))
+    server.response_cache.invalidate_tags(["users", "auctions", "bids"])
+    limit = server.OVERVIEW_PAGE_SIZE
+
+    async def overview(etag: Optional[str] = None):
+        return await server.get_admin_overview(overview_request(etag), limit, None, limit, None, limit, None, ADMIN)
+
+    first = run(overview())
+    body = json.loads(first.body)
+    # Lists are short previews with a cursor to the rest
+    for section in ("users", "auctions", "bids"):
+        assert len(body[section]["items"]) == limit
+        assert body[section]["next_cursor"]
+
+    # Data sections come from the cache; only the health check reaches the database
+    counter.commands.clear()
+    second = run(overview())
+    assert counter.commands == ["find"]
+    health = [json.loads(response.body).pop("health") for response in (first, second)]
+    assert {key: value for key, value in json.loads(second.body).items() if key != "health"} == {
+        key: value for key, value in body.items() if key != "health"
+    }
+    assert health[0]["database"] == "healthy"
+    assert health[1]["timestamp"] != health[0]["timestamp"]
+    assert "etag" not in second.headers
+
+    # A write invalidates the tag and the next request rebuilds
+    async def write():
+        server.invalidate_admin_cache("bids")
+
+    run(write())
+    run(overview())
+    assert counter.round_trips("find") > 0
+
+
+def test_build_racing_an_invalidation_is_not_cached(run, monkeypatch):
+    monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    request = Request({"type": "http", "method": "GET", "path": "/api/admin/users", "query_string": b"", "headers": []})
+    builds = []
+
+    async def build():
+        builds.append(len(builds))
+        if len(builds) == 1:
+            # A write lands after this build read its data
+            server.invalidate_admin_cache("users")
+        return {"build": len(builds)}, None
+
+    async def scenario():
+        responses = [await server.cached_response(request, ["users"], build) for _ in range(3)]
+        return [json.loads(response.body)["build"] for response in responses]
+
+    # The first result is served but not stored; the rebuild is cached and reused
+    assert run(scenario()) == [1, 2, 2]
+
+
+def test_closing_an_auction_invalidates_without_the_event_bus(run, db, monkeypatch):
+    monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    # As if the bus queue were full: the auction_closed event and its room broadcasts are dropped
+    monkeypatch.setattr(server.event_bus, "publish", lambda *args, **kwargs: None)
+    auction = make_auction(ends_at=datetime.utcnow() - timedelta(seconds=1))
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        server.response_cache.set("/api/admin/bids?", (b"[]", '"etag"', {}), ["bids"])
+        closed = await server.close_expired_auction(auction.id)
+        return closed, server.response_cache.get("/api/admin/bids?")
+
+    closed, entry = run(scenario())
+    assert closed
+    assert entry is None
+
+
+def test_invalidation_is_local_first_and_published_off_the_request_path(run, monkeypatch):
+    monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    published = []
+    release = asyncio.Event()
+
+    async def slow_publish(channel, message):
+        # A broker round trip, e.g. the ws_events insert behind WS_BROKER=mongo
+        await release.wait()
+        published.append((channel, message))
+
+    monkeypatch.setattr(server.manager.broker, "publish", slow_publish)
+
+    async def scenario():
+        server.response_cache.set("/api/admin/bids?", (b"[]", '"etag"', {}), ["bids"])
+        server.invalidate_admin_cache("bids", "auctions")
+        dropped = server.response_cache.get("/api/admin/bids?") is None
+        pending = len(server.admin_cache_publishes)
+        release.set()
+        await asyncio.gather(*server.admin_cache_publishes)
+        return dropped, pending
+
+    dropped, pending = run(scenario())
+    assert dropped and pending == 1
+    assert published == [(server.ADMIN_CACHE_CHANNEL, "bids,auctions")]
+    assert not server.admin_cache_publishes
+
+
+def test_evicted_and_expired_entries_leave_the_tag_index(monkeypatch):
+    cache = server.ResponseCache(ttl_seconds=30, max_size=2)
+    entry = (b"[]", '"etag"', {})
+    for after in range(5):
+        cache.set(f"/api/admin/users?after={after}", entry, ["users"])
+    assert cache.keys_by_tag == {"users": {"/api/admin/users?after=3", "/api/admin/users?after=4"}}
+
+    # Past the TTL, a lookup drops the entry and its tags
+    monkeypatch.setattr(server.time, "monotonic", lambda: float("inf"))
+    assert cache.get("/api/admin/users?after=3") is None
+    assert cache.get("/api/admin/users?after=4") is None
+    assert cache.keys_by_tag == {} and cache.tags_by_key == {}
@@ -0,0 +1,82 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import server
+from tests.support import make_auction, make_bid, percentile
+
+
+def test_recompute_rebuilds_closed_days_and_leaves_today_to_increments(run, db):
+    now = datetime.utcnow()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday = today - timedelta(hours=12)
+
+    async def scenario():
+        await db.car_requests.insert_many(
+            [make_auction(created_at=yesterday).dict() for _ in range(3)]
+            + [make_auction(created_at=now).dict() for _ in range(2)]
+        )
+        # Yesterday's rollup drifted; today's has increments the source query hasn't seen yet
+        await db.daily_stats.insert_one({"_id": server.day_key(yesterday), "auctions": 1})
+        await server.record_daily_stats({"auctions": 7}, now)
+        await server.recompute_daily_stats()
+        return (
+            await db.daily_stats.find_one({"_id": server.day_key(yesterday)}),
+            await db.daily_stats.find_one({"_id": server.day_key(now)}),
+        )
+
+    closed_day, current_day = run(scenario())
+    assert closed_day["auctions"] == 3
+    assert current_day["auctions"] == 7
+
+
+def test_top_auctions_follow_bid_counts(run, db):
+    counts = [0, 5, 3, 12, 1, 8, 8, 2, 0, 4, 6, 9, 7, 11, 10]
+    auctions = [make_auction(bid_count=count, lowest_price=30000 - count if count else None) for count in counts]
+
+    async def scenario():
+        await db.car_requests.insert_many([auction.dict() for auction in auctions])
+        return await server.load_top_auctions()
+
+    top = run(scenario())
+    expected = sorted((auction for auction in auctions if auction.bid_count), key=lambda a: (-a.bid_count, a.id))
+    assert [auction["id"] for auction in top] == [auction.id for auction in expected[:server.TOP_AUCTIONS_LIMIT]]
+    assert all(auction["lowest_bid"] == 30000 - auction["bid_count"] for auction in top)
+    assert "lowest_price" not in top[0]
+
+
+@pytest.mark.benchmark
+def test_analytics_response_is_bounded_in_bid_volume(run, db):
+    async def measure(bids):
+        # Both sizes run in this one test body; each starts from empty collections
+        await db.car_requests.delete_many({})
+        await db.bids.delete_many({})
+        auctions = [make_auction() for _ in range(1_000)]
+        per_auction = bids // len(auctions)
+        for index, auction in enumerate(auctions):
+            auction.bid_count = per_auction + index % 50
+            auction.lowest_price = 30000 - auction.bid_count
+        await db.car_requests.insert_many([auction.dict() for auction in auctions])
+        template = make_bid(auctions[0].id, 30000).dict()
+        for start in range(0, bids, 50_000):
+            await db.bids.insert_many([
+                {**template, "id": f"bid-{n}", "auction_id": auctions[n % len(auctions)].id, "price": 30000 - n % 500}
+                for n in range(start, min(bids, start + 50_000))
+            ])
+        samples = []
+        for _ in range(50):
+            started = time.perf_counter()
+            analytics = await server.load_analytics()
+            samples.append(time.perf_counter() - started)
+        return analytics, samples
+
+    timings = {}
+    for bids in (10_000, 1_000_000):
+        analytics, samples = run(measure(bids))
+        size = len(server.encode_event(analytics))
+        timings[bids] = percentile(samples, 0.5)
+        print(f"\n{bids} bids: analytics p50={timings[bids] * 1e3:.2f}ms, response {size} bytes")
+        assert len(analytics["top_auctions"]) == server.TOP_AUCTIONS_LIMIT
+        assert size < 16_384
+    assert timings[1_000_000] < 2 * timings[10_000] + 0.005
@@ -0,0 +1,147 @@
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+import server
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    # Fresh per-test caches, so entries never leak between tests through the module globals
+    user_cache = server.UserCache()
+    token_versions = server.TTLCache()
+    monkeypatch.setattr(server, "user_cache", user_cache)
+    monkeypatch.setattr(server, "token_versions", token_versions)
+    return user_cache, token_versions
+
+
+def bearer(claims: dict) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=server.create_access_token(claims))
+
+
+def make_user_document(**fields) -> dict:
+    user = server.User(email="dealer@example.com", name="Dealer", role=server.UserRole.DEALER, **fields)
+    return {**user.dict(), "password": "hashed", "token_version": 0}
+
+
+def test_invalidate_user_drops_cached_user_and_token_version(run, caches):
+    user_cache, token_versions = caches
+    user = server.User(**make_user_document())
+    user_cache.set(user.email, user)
+    token_versions.set(user.id, 3)
+
+    run(server.invalidate_user(user.id))
+    assert user_cache.get(user.email) is None
+    assert token_versions.get(user.id) is None
+    assert user.id not in user_cache.keys_by_user_id
+
+
+def test_current_user_is_served_from_cache_until_invalidated(run, db, caches):
+    document = make_user_document()
+    credentials = bearer({"sub": document["email"]})
+
+    async def scenario():
+        await db.users.insert_one(document)
+        first = await server.get_current_user(credentials)
+        await db.users.update_one({"id": document["id"]}, {"$set": {"name": "Renamed"}})
+        cached = await server.get_current_user(credentials)
+        await server.invalidate_user(document["id"])
+        fresh = await server.get_current_user(credentials)
+        return first, cached, fresh
+
+    first, cached, fresh = run(scenario())
+    assert (first.name, cached.name, fresh.name) == ("Dealer", "Dealer", "Renamed")
+
+
+def test_token_with_current_version_is_authorized_without_the_database(run, caches, monkeypatch):
+    document = make_user_document()
+    _, token_versions = caches
+    token_versions.set(document["id"], 0)
+    # Any database access would fail: the claims and the cached version are all that's needed
+    monkeypatch.setattr(server, "db", None)
+
+    claims = run(server.get_token_claims(bearer(server.build_token_claims(document))))
+    assert (claims.id, claims.role) == (document["id"], server.UserRole.DEALER)
+
+
+def test_token_with_stale_version_is_reauthorized_from_the_database(run, db, caches):
+    document = make_user_document()
+    stale = bearer(server.build_token_claims(document))
+
+    async def scenario():
+        await db.users.insert_one(document)
+        # An admin deactivates the dealer after the token was issued
+        await db.users.update_one(
+            {"id": document["id"]}, server.user_update_operation({"is_active": False})
+        )
+        await server.invalidate_user(document["id"])
+        return await server.get_token_claims(stale)
+
+    claims = run(scenario())
+    assert claims.is_active is False
+    assert claims.version == 1
+    assert caches[1].get(document["id"]) == 1
+
+
+def test_deleted_users_token_is_rejected(run, db, caches):
+    document = make_user_document()
+    credentials = bearer(server.build_token_claims(document))
+
+    async def scenario():
+        await db.users.insert_one(document)
+        await server.get_token_claims(credentials)
+        await db.users.delete_one({"id": document["id"]})
+        await server.invalidate_user(document["id"])
+        with pytest.raises(server.HTTPException) as rejected:
+            await server.get_token_claims(credentials)
+        return rejected.value
+
+    assert run(scenario()).status_code == 401
+    assert caches[1].get(document["id"]) == -1
+
+
+def test_token_without_embedded_claims_falls_back_to_the_user(run, db, caches):
+    document = make_user_document(dealer_tier=server.DealerTier.GOLD)
+    # Issued before tokens carried uid/ver: only the subject is present
+    legacy = bearer({"sub": document["email"]})
+
+    async def scenario():
+        await db.users.insert_one(document)
+        return await server.get_token_claims(legacy)
+
+    claims = run(scenario())
+    assert (claims.id, claims.role, claims.dealer_tier) == (
+        document["id"], server.UserRole.DEALER, server.DealerTier.GOLD
+    )
+    assert caches[0].get(document["email"]).id == document["id"]
+
+
+class RacingUsers:
+    # users collection whose reads return the pre-update document while the user is invalidated
+    def __init__(self, document: dict):
+        self.document = document
+
+    async def find_one(self, query, projection=None):
+        await server.invalidate_user(self.document["id"])
+        return dict(self.document)
+
+
+class RacingDatabase:
+    def __init__(self, document: dict):
+        self.users = RacingUsers(document)
+
+
+def test_reads_racing_an_invalidation_are_not_cached(run, caches, monkeypatch):
+    user_cache, token_versions = caches
+    document = make_user_document()
+    monkeypatch.setattr(server, "db", RacingDatabase(document))
+
+    async def scenario():
+        user = await server.get_current_user(bearer({"sub": document["email"]}))
+        version = await server.current_token_version(document["id"])
+        return user, version
+
+    user, version = run(scenario())
+    # Both reads are still answered, but neither result outlives the request
+    assert (user.id, version) == (document["id"], 0)
+    assert user_cache.get(document["email"]) is None
+    assert token_versions.get(document["id"]) is None
@@ -0,0 +1,94 @@
+import asyncio
+
+import server
+from tests.support import FakeWebSocket
+
+
+class StalledWebSocket(FakeWebSocket):
+    # A consumer that stops reading: every send blocks until the connection is closed
+    def __init__(self):
+        super().__init__()
+        self.closed = asyncio.Event()
+
+    async def send_text(self, message: str):
+        await self.closed.wait()
+
+    async def close(self, code: int = 1000):
+        self.closed.set()
+
+
+class BrokenWebSocket(FakeWebSocket):
+    async def send_text(self, message: str):
+        raise ConnectionResetError("peer went away")
+
+
+async def connect_with(manager, room: str, stalled: FakeWebSocket, healthy: int):
+    await manager.connect(stalled, "slow-user", "slow")
+    manager.join_room("slow", room)
+    sockets = []
+    for index in range(healthy):
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, f"user-{index}", f"healthy-{index}")
+        manager.join_room(f"healthy-{index}", room)
+        sockets.append(websocket)
+    return sockets
+
+
+def assert_evicted(manager, room: str):
+    assert "slow" not in manager.active_connections
+    assert "slow" not in manager.rooms.get(room, ())
+    assert "slow" not in manager.connection_rooms
+    assert "slow-user" not in manager.user_connections
+    assert manager.evicted_connections == 1
+
+
+def test_full_queue_evicts_only_the_slow_consumer(run, monkeypatch, ws_manager):
+    monkeypatch.setattr(server, "WS_SEND_QUEUE_SIZE", 2)
+    room = server.auction_room("a")
+
+    async def scenario():
+        stalled = StalledWebSocket()
+        healthy = await connect_with(ws_manager, room, stalled, 3)
+        # The stalled writer holds the first frame; the next two fill its queue, the fourth overflows
+        for n in range(4):
+            await ws_manager.broadcast_to_room(server.encode_event({"n": n}), room)
+            await asyncio.sleep(0.01)
+        return stalled, healthy
+
+    stalled, healthy = run(scenario())
+    assert_evicted(ws_manager, room)
+    assert stalled.closed.is_set()
+    # The close task is held until it finishes, then dropped
+    assert not ws_manager.close_tasks
+    assert [len(websocket.frames) for websocket in healthy] == [4, 4, 4]
+
+
+def test_send_timeout_evicts_the_connection(run, monkeypatch, ws_manager):
+    monkeypatch.setattr(server, "WS_SEND_TIMEOUT_SECONDS", 0.05)
+    room = server.auction_room("a")
+
+    async def scenario():
+        healthy = await connect_with(ws_manager, room, StalledWebSocket(), 2)
+        await ws_manager.broadcast_to_room(server.encode_event({"n": 0}), room)
+        await asyncio.sleep(0.2)
+        await ws_manager.broadcast_to_room(server.encode_event({"n": 1}), room)
+        await asyncio.sleep(0.01)
+        return healthy
+
+    healthy = run(scenario())
+    assert_evicted(ws_manager, room)
+    assert [len(websocket.frames) for websocket in healthy] == [2, 2]
+
+
+def test_send_failure_evicts_the_connection(run, ws_manager):
+    room = server.auction_room("a")
+
+    async def scenario():
+        healthy = await connect_with(ws_manager, room, BrokenWebSocket(), 2)
+        await ws_manager.broadcast_to_room(server.encode_event({"n": 0}), room)
+        await asyncio.sleep(0.01)
+        return healthy
+
+    healthy = run(scenario())
+    assert_evicted(ws_manager, room)
+    assert [len(websocket.frames) for websocket in healthy] == [1, 1]
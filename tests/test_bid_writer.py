@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+import server
+from tests.support import make_bid
+
+
+def test_concurrent_writes_are_batched(run, db):
+    writer = server.BidWriteBuffer(batch_size=50, flush_ms=5)
+    documents = [make_bid("auction-1", 30000 - n, dealer=n).dict() for n in range(123)]
+
+    async def scenario():
+        await asyncio.gather(*(writer.write(document) for document in documents))
+        await writer.close()
+        return await db.bids.count_documents({"auction_id": "auction-1"})
+
+    assert run(scenario()) == 123
+    assert (writer.batches, writer.written) == (3, 123)
+    # Flush tasks drop out of the set once done, so nothing is kept alive past the batch
+    assert not writer.tasks and not writer.pending
+
+
+def test_failed_document_fails_only_its_own_write(run, db):
+    writer = server.BidWriteBuffer(batch_size=10, flush_ms=5)
+    first = make_bid("auction-1", 30000).dict()
+    duplicate = {**make_bid("auction-1", 29000).dict(), "id": first["id"]}
+    other = make_bid("auction-1", 28000).dict()
+
+    async def scenario():
+        await writer.write(first)
+        return await asyncio.gather(writer.write(duplicate), writer.write(other), return_exceptions=True)
+
+    duplicate_result, other_result = run(scenario())
+    assert isinstance(duplicate_result, BulkWriteError)
+    assert other_result is None
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("dealers", [1, 10, 100])
+def test_writer_throughput(run, db, dealers):
+    bids_per_dealer = 2_000 // dealers
+
+    async def dealer_loop(write, dealer):
+        for n in range(bids_per_dealer):
+            await write(make_bid(f"auction-{dealer}", 30000 - n, dealer=dealer).dict())
+
+    async def measure(write):
+        started = time.perf_counter()
+        await asyncio.gather(*(dealer_loop(write, dealer) for dealer in range(dealers)))
+        return dealers * bids_per_dealer / (time.perf_counter() - started)
+
+    writer = server.BidWriteBuffer()
+    batched = run(measure(writer.write))
+    single = run(measure(db.bids.insert_one))
+    print(
+        f"\n{dealers} dealers: write-behind {batched:.0f} bids/s "
+        f"(average batch {writer.stats()['average_batch_size']}), insert_one {single:.0f} bids/s"
+    )
+    if dealers > 1:
+        assert writer.stats()["average_batch_size"] > 1
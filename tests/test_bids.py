@@ -0,0 +1,180 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from tests.support import make_auction, make_bid, percentile
+
+
+def test_bid_summary_backfill_runs_once(run, db):
+    auction = make_auction()
+    legacy = auction.dict()
+    for field in ("lowest_price", "winning_bid_id", "bid_count"):
+        del legacy[field]
+    bids = [make_bid(auction.id, price) for price in (30000, 29000, 29500)]
+
+    async def scenario():
+        await db.car_requests.insert_one(legacy)
+        await db.bids.insert_many([bid.dict() for bid in bids])
+        await server.run_once("bid_summaries", server.backfill_bid_summaries)
+        first = await db.car_requests.find_one({"id": auction.id})
+        # Once recorded, later boots skip the scan even if a summary goes missing
+        await db.car_requests.update_one({"id": auction.id}, {"$unset": {"bid_count": ""}})
+        await server.run_once("bid_summaries", server.backfill_bid_summaries)
+        second = await db.car_requests.find_one({"id": auction.id})
+        return first, second
+
+    first, second = run(scenario())
+    assert (first["lowest_price"], first["winning_bid_id"], first["bid_count"]) == (29000, bids[1].id, 3)
+    assert "bid_count" not in second
+
+
+def test_concurrent_bids_record_strictly_decreasing_winners(run, db):
+    auction = make_auction(max_budget=100_000)
+    prices = random.Random(11).sample(range(20_000, 90_000), 200)
+
+    async def attempt(dealer, price):
+        try:
+            claimed = await server.place_bid(make_bid(auction.id, price, dealer=dealer))
+        except HTTPException:
+            return None
+        return claimed["bid_count"], price
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        results = await asyncio.gather(*(attempt(dealer, price) for dealer, price in enumerate(prices)))
+        final = await db.car_requests.find_one({"id": auction.id})
+        stored = await db.bids.find({"auction_id": auction.id}).to_list(None)
+        return results, final, stored
+
+    results, final, stored = run(scenario())
+    # bid_count returned by each claim is that bid's position among recorded winners
+    accepted = sorted(result for result in results if result is not None)
+    assert [count for count, _ in accepted] == list(range(1, len(accepted) + 1))
+    winners = [price for _, price in accepted]
+    assert all(earlier > later for earlier, later in zip(winners, winners[1:]))
+
+    assert final["lowest_price"] == min(prices)
+    assert final["bid_count"] == len(accepted)
+    # Rejected bids were never stored and the winner points at a stored bid
+    assert sorted(bid["price"] for bid in stored) == sorted(winners)
+    assert {bid["id"]: bid["price"] for bid in stored}[final["winning_bid_id"]] == min(prices)
+
+
+def failing_writes(monkeypatch, failures: int):
+    # The next `failures` writes are held until all of them arrived, then fail together like
+    # one insert_many batch; later writes go through to the real buffer
+    write = server.bid_writer.write
+    held = []
+    batch_full = asyncio.Event()
+
+    async def write_or_fail(document):
+        if len(held) >= failures:
+            return await write(document)
+        held.append(document["id"])
+        if len(held) == failures:
+            batch_full.set()
+        await batch_full.wait()
+        raise ConnectionError("bid batch failed")
+
+    monkeypatch.setattr(server.bid_writer, "write", write_or_fail)
+    return held
+
+
+def test_failed_bid_write_leaves_the_auction_unclaimed(run, db, monkeypatch):
+    auction = make_auction()
+    first = make_bid(auction.id, 30000)
+    failed = make_bid(auction.id, 25000, dealer=2)
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await server.place_bid(first)
+        failing_writes(monkeypatch, 1)
+        with pytest.raises(ConnectionError):
+            await server.place_bid(failed)
+        return await db.car_requests.find_one({"id": auction.id})
+
+    final = run(scenario())
+    assert (final["lowest_price"], final["winning_bid_id"], final["bid_count"]) == (30000, first.id, 1)
+
+
+def test_chained_claims_failing_in_one_batch_fall_back_to_the_stored_winner(run, db, monkeypatch):
+    auction = make_auction()
+    stored = make_bid(auction.id, 30000)
+    displaced, latest = make_bid(auction.id, 29000, dealer=2), make_bid(auction.id, 28000, dealer=3)
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await server.place_bid(stored)
+        held = failing_writes(monkeypatch, 2)
+        # latest claims over displaced, which claimed over stored; neither write lands
+        first_claim = asyncio.ensure_future(server.place_bid(displaced))
+        while not held:
+            await asyncio.sleep(0.001)
+        results = await asyncio.gather(first_claim, server.place_bid(latest), return_exceptions=True)
+        final = await db.car_requests.find_one({"id": auction.id})
+        # The next bid only has to undercut the stored winner
+        await server.place_bid(make_bid(auction.id, 29500, dealer=4))
+        return results, final
+
+    results, final = run(scenario())
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert (final["lowest_price"], final["winning_bid_id"], final["bid_count"]) == (30000, stored.id, 1)
+
+
+def test_rejected_bid_is_never_stored_or_counted(run, db):
+    auction = make_auction()
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await server.reconcile_counters()
+        await server.place_bid(make_bid(auction.id, 30000))
+        with pytest.raises(HTTPException):
+            await server.place_bid(make_bid(auction.id, 30500, dealer=2))
+        return (
+            await db.bids.count_documents({"auction_id": auction.id}),
+            await db.counters.find_one({"_id": server.COUNTERS_ID}),
+            await db.daily_stats.find_one({"_id": server.day_key(datetime.utcnow())}),
+        )
+
+    stored, counters, today = run(scenario())
+    assert stored == 1
+    assert counters["bids_total"] == 1
+    assert today["bids"] == 1
+
+
+@pytest.mark.benchmark
+def test_bid_latency_is_flat_in_existing_bids(run, db):
+    floor = 1_000_000
+
+    async def measure(existing):
+        # Each size gets its own auction, so every measurement runs in this one test body
+        auction = make_auction(max_budget=10_000_000)
+        await db.car_requests.insert_one(auction.dict())
+        for start in range(0, existing, 10_000):
+            await db.bids.insert_many([
+                make_bid(auction.id, floor + existing - n, dealer=n % 100).dict()
+                for n in range(start, min(existing, start + 10_000))
+            ])
+        await db.car_requests.update_one(
+            {"id": auction.id}, {"$set": {"lowest_price": floor + 1, "bid_count": existing}}
+        )
+        samples = []
+        for n in range(100):
+            started = time.perf_counter()
+            await server.place_bid(make_bid(auction.id, floor - n))
+            samples.append(time.perf_counter() - started)
+        return samples
+
+    latencies = {}
+    for existing in (10, 1_000, 100_000):
+        samples = run(measure(existing))
+        latencies[existing] = percentile(samples, 0.5)
+        print(f"\n{existing} existing bids: place_bid p50={latencies[existing] * 1e3:.2f}ms "
+              f"p99={percentile(samples, 0.99) * 1e3:.2f}ms")
+    for existing in (1_000, 100_000):
+        assert latencies[existing] < 2 * latencies[10] + 0.005
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+import server
+from tests.support import FakeWebSocket, drain
+
+
+def test_broker_requires_publish():
+    with pytest.raises(TypeError):
+        server.Broker()
+
+
+def test_room_broadcast_reaches_only_room_members(run, ws_manager, connect_clients):
+    async def scenario():
+        bidders = await connect_clients(ws_manager, 3, server.auction_room("a"))
+        others = await connect_clients(ws_manager, 2, server.auction_room("b"))
+        await ws_manager.broadcast_to_auction(server.encode_event({"type": "new_bid"}), "a")
+        await drain(ws_manager)
+        return bidders, others
+
+    bidders, others = run(scenario())
+    assert [len(socket.frames) for socket in bidders] == [1, 1, 1]
+    assert [len(socket.frames) for socket in others] == [0, 0]
+
+
+def test_ws_events_ttl_index_is_registered(run, db):
+    indexes = run(db.ws_events.index_information())
+    ttl = [index for index in indexes.values() if "expireAfterSeconds" in index]
+    assert ttl and ttl[0]["key"] == [("created_at", 1)]
+
+
+@pytest.fixture
+def replica_set(run, db):
+    hello = run(db.command("hello"))
+    if "setName" not in hello:
+        pytest.skip("change streams need MongoDB running as a replica set")
+    return db
+
+
+def test_mongo_broker_delivers_across_nodes(run, replica_set):
+    # Two brokers with distinct node ids on one collection stand in for two workers
+    nodes = [
+        server.ConnectionManager(server.MongoChangeStreamBroker(replica_set.ws_events, node_id=str(uuid.uuid4())))
+        for _ in range(2)
+    ]
+    room = server.auction_room("shared")
+
+    async def scenario():
+        sockets = []
+        for index, manager in enumerate(nodes):
+            await manager.broker.start()
+            websocket = FakeWebSocket()
+            await manager.connect(websocket, f"dealer-{index}", f"conn-{index}")
+            manager.join_room(f"conn-{index}", room)
+            sockets.append(websocket)
+
+        # Change streams open asynchronously; probe until the second node is listening
+        for _ in range(100):
+            await nodes[0].broadcast_to_room(server.encode_event({"type": "probe"}), room)
+            await asyncio.sleep(0.05)
+            await drain(nodes[1])
+            if sockets[1].frames:
+                break
+        for websocket in sockets:
+            websocket.frames.clear()
+
+        await nodes[0].broadcast_to_room(server.encode_event({"type": "new_bid", "price": 100}), room)
+        await asyncio.sleep(0.5)
+        for manager in nodes:
+            await drain(manager)
+        return sockets
+
+    try:
+        sockets = run(scenario())
+    finally:
+
+        async def stop():
+            for index, manager in enumerate(nodes):
+                manager.disconnect(f"dealer-{index}", f"conn-{index}")
+                await manager.broker.stop()
+
+        run(stop())
+
+    # Remote delivery through the change stream, local delivery exactly once
+    assert [json.loads(frame)["type"] for frame in sockets[1].frames] == ["new_bid"]
+    assert [json.loads(frame)["type"] for frame in sockets[0].frames] == ["new_bid"]
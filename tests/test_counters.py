@@ -0,0 +1,53 @@
+import asyncio
+
+import server
+from tests.support import make_auction, make_bid
+
+
+def test_reconcile_repairs_drift_without_losing_concurrent_increments(run, db, monkeypatch):
+    auction = make_auction()
+    compute = server.compute_dashboard_counts
+
+    async def compute_then_bid():
+        # A bid is stored and counted after the source counts were read
+        counts = await compute()
+        await db.bids.insert_one(make_bid(auction.id, 27000, dealer=4).dict())
+        await server.increment_counters({"bids_total": 1})
+        return counts
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await db.bids.insert_many([make_bid(auction.id, 30000 - n, dealer=n).dict() for n in range(3)])
+        await server.reconcile_counters()
+        first = await db.counters.find_one({"_id": server.COUNTERS_ID})
+        await server.increment_counters({"bids_total": 10, "auctions_total": -1})
+        monkeypatch.setattr(server, "compute_dashboard_counts", compute_then_bid)
+        await server.reconcile_counters()
+        second = await db.counters.find_one({"_id": server.COUNTERS_ID})
+        return first, second
+
+    first, second = run(scenario())
+    assert (first["bids_total"], first["auctions_total"], first["auctions_active"]) == (3, 1, 1)
+    assert (second["bids_total"], second["auctions_total"]) == (4, 1)
+
+
+def test_overlapping_reconciliations_apply_once(run, db):
+    auction = make_auction()
+
+    async def reconcile_together():
+        await asyncio.gather(*(server.reconcile_counters() for _ in range(3)))
+        return await db.counters.find_one({"_id": server.COUNTERS_ID})
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await db.bids.insert_many([make_bid(auction.id, 30000 - n, dealer=n).dict() for n in range(3)])
+        # Workers booting together on an empty document, then again after the counters drifted
+        created = await reconcile_together()
+        await server.increment_counters({"bids_total": 5})
+        repaired = await reconcile_together()
+        return created, repaired
+
+    created, repaired = run(scenario())
+    assert (created["bids_total"], created["auctions_total"]) == (3, 1)
+    assert repaired["bids_total"] == 3
+    assert repaired["generation"] > created["generation"]
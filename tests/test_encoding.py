@@ -0,0 +1,62 @@
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+import server
+from tests.support import drain
+
+EVENT = {
+    "type": "new_bid",
+    "auction_id": "auction-1",
+    "bid": {
+        "id": "bid-1",
+        "price": 31500.0,
+        "status": server.BidStatus.WINNING,
+        "dealer_tier": server.DealerTier.PREMIUM,
+        "created_at": datetime(2025, 7, 1, 12, 30, 15, 250000),
+    },
+}
+
+
+@pytest.mark.parametrize("fast_encoder", [True, False])
+def test_encode_event_handles_datetimes_and_enums(monkeypatch, fast_encoder):
+    if not fast_encoder:
+        monkeypatch.setattr(server, "orjson", None)
+    decoded = json.loads(server.encode_event(EVENT))
+    assert decoded["bid"]["status"] == "winning"
+    assert decoded["bid"]["dealer_tier"] == "premium"
+    assert decoded["bid"]["created_at"] == "2025-07-01T12:30:15.250000"
+
+
+def test_room_broadcast_shares_one_encoded_frame(run, ws_manager, connect_clients):
+    async def scenario():
+        sockets = await connect_clients(ws_manager, 50, server.auction_room("auction-1"))
+        await ws_manager.broadcast_to_auction(server.encode_event(EVENT), "auction-1")
+        await drain(ws_manager)
+        return sockets
+
+    sockets = run(scenario())
+    frames = [socket.frames[0] for socket in sockets]
+    assert all(frame is frames[0] for frame in frames)
+
+
+@pytest.mark.benchmark
+def test_encoding_cost_per_10k_recipients():
+    recipients = 10_000
+    started = time.perf_counter()
+    shared = server.encode_event(EVENT)
+    frames = [shared] * recipients
+    encode_once = time.perf_counter() - started
+
+    started = time.perf_counter()
+    frames = [json.dumps(EVENT, default=server._json_default) for _ in range(recipients)]
+    encode_per_recipient = time.perf_counter() - started
+
+    print(
+        f"\n10k recipients: encode once {encode_once * 1e3:.3f}ms, "
+        f"encode per recipient {encode_per_recipient * 1e3:.1f}ms"
+    )
+    assert len(frames) == recipients
+    assert encode_once * 100 < encode_per_recipient
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import pytest
+
+import server
+from tests.support import drain, percentile
+
+
+@pytest.fixture
+def bus(run):
+    bus = server.EventBus(dispatchers=2)
+
+    async def start():
+        bus.start()
+
+    run(start())
+    yield bus
+    run(bus.stop())
+
+
+def test_publish_returns_before_handlers_run(run, bus):
+    release = asyncio.Event()
+    delivered = []
+
+    async def handler(event):
+        await release.wait()
+        delivered.append(event["n"])
+
+    bus.subscribe("slow", handler)
+
+    async def scenario():
+        bus.publish("slow", {"n": 1})
+        assert delivered == []
+        release.set()
+        while not delivered:
+            await asyncio.sleep(0.001)
+
+    run(asyncio.wait_for(scenario(), 5))
+    assert delivered == [1]
+
+
+def test_events_sharing_a_key_keep_their_order(run, bus):
+    delivered = []
+
+    async def handler(event):
+        await asyncio.sleep(0)
+        delivered.append(event["n"])
+
+    bus.subscribe("ordered", handler)
+
+    async def scenario():
+        for n in range(100):
+            bus.publish("ordered", {"n": n}, key="auction-1")
+        while len(delivered) < 100:
+            await asyncio.sleep(0.001)
+
+    run(asyncio.wait_for(scenario(), 5))
+    assert delivered == list(range(100))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("audience", [10, 1_000, 10_000])
+def test_bid_publish_latency_is_independent_of_audience(run, bus, ws_manager, connect_clients, audience):
+    # The request path ends at event_bus.publish; delivery to the room happens on dispatchers
+    async def deliver(event):
+        await ws_manager.broadcast_to_auction(server.encode_event(event), event["auction_id"])
+
+    bus.subscribe("new_bid", deliver)
+
+    async def scenario():
+        await connect_clients(ws_manager, audience, server.auction_room("auction-1"))
+        samples = []
+        for n in range(100):
+            started = time.perf_counter()
+            bus.publish("new_bid", {"auction_id": "auction-1", "n": n}, key="auction-1")
+            samples.append(time.perf_counter() - started)
+            if n % 20 == 19:
+                await asyncio.sleep(0)
+                await drain(ws_manager)
+        await drain(ws_manager)
+        return samples
+
+    samples = run(scenario())
+    p50, p99 = percentile(samples, 0.5), percentile(samples, 0.99)
+    print(f"\naudience={audience}: publish p50={p50 * 1e6:.1f}us p99={p99 * 1e6:.1f}us")
+    assert p99 < 0.001
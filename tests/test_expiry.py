@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from tests.support import make_auction
+
+ADMIN = server.User(id="admin-1", email="admin@example.com", name="Admin", role=server.UserRole.ADMIN)
+
+
+@pytest.fixture
+def closes(monkeypatch):
+    # close_expired_auction stubbed: records the order auctions are closed in
+    closed = []
+
+    async def close(auction_id):
+        closed.append(auction_id)
+        return True
+
+    monkeypatch.setattr(server, "close_expired_auction", close)
+    return closed
+
+
+@pytest.fixture
+def scheduler(run):
+    scheduler = server.AuctionExpiryScheduler()
+    yield scheduler
+    run(scheduler.stop())
+
+
+async def wait_for(condition, timeout: float = 2):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def in_seconds(seconds: float) -> datetime:
+    return datetime.utcnow() + timedelta(seconds=seconds)
+
+
+def test_auctions_close_in_deadline_order(run, scheduler, closes):
+    async def scenario():
+        scheduler.schedule("late", in_seconds(0.15))
+        scheduler.schedule("first", in_seconds(0.05))
+        scheduler.schedule("middle", in_seconds(0.1))
+        scheduler.start()
+        await wait_for(lambda: len(closes) == 3)
+
+    run(scenario())
+    assert closes == ["first", "middle", "late"]
+    assert scheduler.closed_auctions == 3
+    assert scheduler.stats()["scheduled_auctions"] == 0
+
+
+def test_earlier_deadline_wakes_the_sleeping_task(run, scheduler, closes):
+    async def scenario():
+        scheduler.schedule("distant", in_seconds(3600))
+        scheduler.start()
+        await asyncio.sleep(0.02)
+        scheduler.schedule("soon", in_seconds(0.05))
+        await wait_for(lambda: closes)
+
+    run(scenario())
+    assert closes == ["soon"]
+    assert scheduler.stats()["scheduled_auctions"] == 1
+
+
+def test_failed_close_is_retried(run, monkeypatch, scheduler):
+    monkeypatch.setattr(server, "EXPIRY_RETRY_SECONDS", 0.05)
+    attempts = []
+
+    async def flaky_close(auction_id):
+        attempts.append(auction_id)
+        if len(attempts) == 1:
+            raise ConnectionError("primary stepped down")
+        return True
+
+    monkeypatch.setattr(server, "close_expired_auction", flaky_close)
+
+    async def scenario():
+        scheduler.schedule("auction-1", in_seconds(0))
+        scheduler.start()
+        await wait_for(lambda: scheduler.closed_auctions)
+
+    run(scenario())
+    assert attempts == ["auction-1", "auction-1"]
+
+
+def test_conditional_close_skips_cancelled_and_rescheduled_auctions(run, db):
+    expired = make_auction(ends_at=in_seconds(-1))
+    cancelled = make_auction(ends_at=in_seconds(-1), status=server.AuctionStatus.CANCELLED)
+    # Scheduled for its old deadline, then extended before the close ran
+    rescheduled = make_auction(ends_at=in_seconds(3600))
+
+    async def scenario():
+        await db.car_requests.insert_many([auction.dict() for auction in (expired, cancelled, rescheduled)])
+        results = [await server.close_expired_auction(auction.id) for auction in (expired, cancelled, rescheduled)]
+        statuses = {auction["id"]: auction["status"] for auction in await db.car_requests.find().to_list(None)}
+        return results, statuses
+
+    results, statuses = run(scenario())
+    assert results == [True, False, False]
+    assert statuses == {expired.id: "closed", cancelled.id: "cancelled", rescheduled.id: "active"}
+
+
+def test_reactivating_an_ended_auction_needs_a_new_deadline(run, db, monkeypatch):
+    scheduler = server.AuctionExpiryScheduler()
+    monkeypatch.setattr(server, "expiry_scheduler", scheduler)
+    auction = make_auction(ends_at=in_seconds(-60), status=server.AuctionStatus.CLOSED)
+    new_deadline = in_seconds(3600)
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        with pytest.raises(HTTPException) as rejected:
+            await server.update_auction_status(auction.id, {"status": "active"}, ADMIN)
+        unchanged = await db.car_requests.find_one({"id": auction.id})
+        await server.update_auction_status(
+            auction.id, {"status": "active", "ends_at": new_deadline.isoformat()}, ADMIN
+        )
+        return rejected.value, unchanged, await db.car_requests.find_one({"id": auction.id})
+
+    rejected, unchanged, reactivated = run(scenario())
+    assert rejected.status_code == 400
+    assert unchanged["status"] == "closed"
+    assert reactivated["status"] == "active"
+    assert abs(reactivated["ends_at"] - new_deadline) < timedelta(milliseconds=1)
+    assert scheduler.deadlines == {auction.id: new_deadline}
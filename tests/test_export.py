@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import server
+
+# A million rows takes a while per format, so the default suite streams a smaller export
+EXPORT_ROWS = int(os.environ.get(
+    "EXPORT_TEST_ROWS", "1000000" if os.environ.get("RUN_BENCHMARKS") == "1" else "100000"
+))
+RSS_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class SyntheticCursor:
+    # Yields rows on demand like a Motor cursor, so nothing is held beyond the current row
+    def __init__(self, rows: int):
+        self.rows = rows
+
+    def batch_size(self, size: int) -> "SyntheticCursor":
+        return self
+
+    async def __aiter__(self):
+        started = datetime(2025, 1, 1)
+        for n in range(self.rows):
+            yield {
+                "id": f"auction-{n}",
+                "buyer_id": f"buyer-{n % 1000}",
+                "title": "Family SUV",
+                "make": "Toyota",
+                "model": "RAV4",
+                "year": 2023,
+                "max_budget": 50000.0,
+                "location": "Austin, TX",
+                "status": server.AuctionStatus.ACTIVE,
+                "created_at": started + timedelta(seconds=n),
+                "ends_at": started + timedelta(days=1, seconds=n),
+                "winning_bid_id": None,
+                "lowest_price": None,
+                "bid_count": 0,
+            }
+
+
+class SyntheticDatabase:
+    def __init__(self, rows: int):
+        self.rows = rows
+
+    def __getitem__(self, name: str):
+        return self
+
+    def find(self, query, projection=None) -> SyntheticCursor:
+        return SyntheticCursor(self.rows)
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def export_chunks(run, monkeypatch, rows: int, export_format: str):
+    monkeypatch.setattr(server, "db", SyntheticDatabase(rows))
+
+    async def collect():
+        return [chunk async for chunk in server._stream_export(server.EXPORTS["car-requests"], {}, export_format)]
+
+    return run(collect())
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_rows_round_trip(run, monkeypatch, export_format):
+    body = "".join(export_chunks(run, monkeypatch, 2_500, export_format))
+    fields = server.EXPORTS["car-requests"]["fields"]
+    if export_format == "ndjson":
+        rows = [json.loads(line) for line in body.splitlines()]
+    else:
+        reader = csv.reader(io.StringIO(body))
+        assert next(reader) == fields
+        rows = [dict(zip(fields, row)) for row in reader]
+    assert len(rows) == 2_500
+    assert rows[-1]["id"] == "auction-2499"
+    assert rows[0]["status"] == "active"
+    assert rows[0]["created_at"] == "2025-01-01T00:00:00"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="RSS is read from /proc")
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_memory_stays_flat(run, monkeypatch, export_format):
+    monkeypatch.setattr(server, "db", SyntheticDatabase(EXPORT_ROWS))
+
+    async def consume():
+        # Chunks are dropped as soon as they are "sent", like a StreamingResponse does
+        exported = 0
+        baseline = peak = None
+        async for chunk in server._stream_export(server.EXPORTS["car-requests"], {}, export_format):
+            exported += chunk.count("\n")
+            if baseline is None:
+                baseline = rss_bytes()
+            elif exported % 50_000 < server.EXPORT_BATCH_SIZE:
+                peak = max(peak or 0, rss_bytes())
+        return exported, baseline, peak or baseline
+
+    exported, baseline, peak = run(consume())
+    print(f"\n{EXPORT_ROWS} rows as {export_format}: RSS grew {(peak - baseline) / 1e6:.1f}MB")
+    assert exported == EXPORT_ROWS + (1 if export_format == "csv" else 0)
+    assert peak - baseline < RSS_BUDGET_BYTES
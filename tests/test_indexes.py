@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import ASCENDING, DESCENDING
+
+import server
+
+ROWS = 500
+
+# (collection, filter, sort field, direction) for every fetch_page call in server.py
+PAGINATED_QUERIES = [
+    ("car_requests", {"buyer_id": "buyer-1"}, "created_at", DESCENDING),
+    ("car_requests", {"status": server.AuctionStatus.ACTIVE}, "ends_at", ASCENDING),
+    ("car_requests", {}, "created_at", DESCENDING),
+    ("bids", {"auction_id": "auction-1"}, "price", ASCENDING),
+    ("bids", {"dealer_id": "dealer-1"}, "created_at", DESCENDING),
+    ("bids", {}, "created_at", DESCENDING),
+    ("users", {}, "created_at", DESCENDING),
+]
+
+# Point reads and batched $in lookups
+LOOKUPS = [
+    ("users", {"email": "user-1@example.com"}),
+    ("users", {"id": "user-1"}),
+    ("users", {"id": {"$in": ["user-1", "user-2", "user-3"]}}),
+    ("car_requests", {"id": "auction-1"}),
+    ("car_requests", {"id": {"$in": ["auction-1", "auction-2", "auction-3"]}}),
+    ("car_requests", {"status": server.AuctionStatus.ACTIVE}),
+]
+
+
+def plan_stages(plan) -> list:
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(plan_stages(value))
+    return stages
+
+
+async def explain(db, command: dict) -> list:
+    result = await db.command("explain", command, verbosity="queryPlanner")
+    return plan_stages(result["queryPlanner"]["winningPlan"])
+
+
+@pytest.fixture
+def seeded(run, db):
+    # Enough documents that the planner has a real choice between index and collection scans
+    now = datetime.utcnow()
+
+    async def seed():
+        await db.users.insert_many([
+            {"id": f"user-{n}", "email": f"user-{n}@example.com", "created_at": now - timedelta(minutes=n)}
+            for n in range(ROWS)
+        ])
+        await db.car_requests.insert_many([
+            {
+                "id": f"auction-{n}",
+                "buyer_id": f"buyer-{n % 10}",
+                "status": server.AuctionStatus.ACTIVE if n % 2 else server.AuctionStatus.CLOSED,
+                "max_budget": 50000,
+                "lowest_price": None,
+                "bid_count": n % 7,
+                "ends_at": now + timedelta(minutes=n),
+                "created_at": now - timedelta(minutes=n),
+            }
+            for n in range(ROWS)
+        ])
+        await db.bids.insert_many([
+            {
+                "id": f"bid-{n}",
+                "auction_id": f"auction-{n % 10}",
+                "dealer_id": f"dealer-{n % 10}",
+                "price": 40000 - n,
+                "created_at": now - timedelta(seconds=n),
+            }
+            for n in range(ROWS)
+        ])
+
+    run(seed())
+    return db
+
+
+def page_cursor(run, db, collection, query, sort_field, direction) -> str:
+    # A cursor from the middle of the first page, as a client would send back
+    documents = run(db[collection].find(query).sort([(sort_field, direction), ("id", direction)]).to_list(5))
+    return server.encode_cursor(documents[-1], sort_field)
+
+
+@pytest.mark.parametrize("collection,query,sort_field,direction", PAGINATED_QUERIES)
+@pytest.mark.parametrize("with_cursor", [False, True])
+def test_paginated_queries_walk_an_index(run, seeded, collection, query, sort_field, direction, with_cursor):
+    after = page_cursor(run, seeded, collection, query, sort_field, direction) if with_cursor else None
+    stages = run(explain(seeded, {
+        "find": collection,
+        "filter": server.keyset_filter(query, sort_field, direction, after),
+        "sort": {sort_field: direction, "id": direction},
+        "limit": server.DEFAULT_PAGE_SIZE + 1,
+    }))
+    assert "COLLSCAN" not in stages
+    # Keyset pages come straight off the index, never from an in-memory sort
+    assert "SORT" not in stages
+
+
+@pytest.mark.parametrize("collection,query", LOOKUPS)
+def test_lookups_use_an_index(run, seeded, collection, query):
+    stages = run(explain(seeded, {"find": collection, "filter": query}))
+    assert "COLLSCAN" not in stages
+
+
+def test_bid_claim_uses_an_index(run, seeded):
+    stages = run(explain(seeded, {
+        "findAndModify": "car_requests",
+        "query": server.bid_claim_filter("auction-1", 30000),
+        "update": {"$set": {"lowest_price": 30000, "winning_bid_id": "bid-x"}, "$inc": {"bid_count": 1}},
+    }))
+    assert "COLLSCAN" not in stages
+
+
+def test_top_auctions_read_the_bid_count_index(run, seeded):
+    stages = run(explain(seeded, {
+        "find": "car_requests",
+        "filter": {"bid_count": {"$gt": 0}},
+        "sort": {"bid_count": DESCENDING, "id": ASCENDING},
+        "limit": server.TOP_AUCTIONS_LIMIT,
+    }))
+    assert "COLLSCAN" not in stages
+    assert "SORT" not in stages
@@ -0,0 +1,91 @@
+import asyncio
+import random
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from tests.support import make_auction, make_bid
+
+
+@pytest.fixture
+def engine(run):
+    engine = server.BidEngine()
+    yield engine
+    run(engine.stop())
+
+
+async def submit_all(submit, auction_id, prices):
+    async def attempt(dealer, price):
+        try:
+            return await submit(make_bid(auction_id, price, dealer=dealer))
+        except HTTPException:
+            return None
+
+    return await asyncio.gather(*(attempt(dealer, price) for dealer, price in enumerate(prices)))
+
+
+def test_order_book_records_strictly_decreasing_winners(run, db, engine):
+    auction = make_auction(max_budget=100_000)
+    prices = random.Random(13).sample(range(20_000, 90_000), 300)
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        results = await submit_all(engine.submit, auction.id, prices)
+        final = await db.car_requests.find_one({"id": auction.id})
+        stored = await db.bids.find({"auction_id": auction.id}).to_list(None)
+        return results, final, stored
+
+    results, final, stored = run(scenario())
+    # Bids reach the actor in submission order, so accepted prices must keep falling
+    winners = [bid.price for bid in results if bid is not None]
+    assert all(earlier > later for earlier, later in zip(winners, winners[1:]))
+    assert final["lowest_price"] == min(prices)
+    assert final["bid_count"] == len(winners)
+    assert sorted(bid["price"] for bid in stored) == sorted(winners)
+    assert {bid["id"]: bid["price"] for bid in stored}[final["winning_bid_id"]] == min(prices)
+
+
+def test_order_book_rebuilds_after_a_direct_write(run, db, engine):
+    auction = make_auction()
+
+    async def scenario():
+        await db.car_requests.insert_one(auction.dict())
+        await engine.submit(make_bid(auction.id, 30000))
+        # Lands behind the book's back; the book still believes 30000 is the lowest price
+        await server.place_bid(make_bid(auction.id, 25000, dealer=2))
+        with pytest.raises(HTTPException):
+            await engine.submit(make_bid(auction.id, 27000, dealer=3))
+        await engine.submit(make_bid(auction.id, 20000, dealer=4))
+        final = await db.car_requests.find_one({"id": auction.id})
+        stored = await db.bids.find({"auction_id": auction.id}).to_list(None)
+        return final, stored
+
+    final, stored = run(scenario())
+    assert (final["lowest_price"], final["bid_count"]) == (20000, 3)
+    assert sorted(bid["price"] for bid in stored) == [20000, 25000, 30000]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("bids", [100, 1_000])
+def test_order_book_against_direct_path(run, db, engine, bids):
+    prices = random.Random(17).sample(range(20_000, 900_000), bids)
+    timings = {}
+
+    async def measure(name, submit):
+        auction = make_auction(max_budget=1_000_000)
+        await db.car_requests.insert_one(auction.dict())
+        started = time.perf_counter()
+        results = await submit_all(submit, auction.id, prices)
+        timings[name] = time.perf_counter() - started
+        return sum(result is not None for result in results)
+
+    direct_accepted = run(measure("direct", server.place_bid))
+    engine_accepted = run(measure("orderbook", engine.submit))
+    print(
+        f"\n{bids} concurrent bids on one auction: "
+        f"direct {timings['direct'] * 1e3:.0f}ms ({bids / timings['direct']:.0f} bids/s, {direct_accepted} accepted), "
+        f"orderbook {timings['orderbook'] * 1e3:.0f}ms ({bids / timings['orderbook']:.0f} bids/s, {engine_accepted} accepted)"
+    )
+    assert direct_accepted and engine_accepted
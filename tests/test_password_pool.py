@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+@pytest.fixture(scope="module")
+def hashed():
+    return server.hash_password("Password123!")
+
+
+@pytest.fixture
+def pool():
+    pool = server.PasswordPool(workers=2, max_pending=4)
+    yield pool
+    pool.executor.shutdown(wait=True)
+
+
+def test_verify_runs_in_pool(run, pool, hashed):
+    assert run(pool.verify("Password123!", hashed)) is True
+    assert run(pool.verify("wrong", hashed)) is False
+    assert pool.pending == 0
+
+
+def test_requests_beyond_pending_limit_are_rejected(run, pool, hashed):
+    async def burst():
+        return await asyncio.gather(
+            *(pool.verify("Password123!", hashed) for _ in range(6)), return_exceptions=True
+        )
+
+    results = run(burst())
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+    assert [error.status_code for error in rejected] == [503, 503]
+    assert results.count(True) == 4
+    assert pool.stats()["rejected"] == 2
+
+
+async def max_loop_stall(work) -> float:
+    # Longest gap between 5 ms heartbeats while `work` runs
+    stalls = []
+
+    async def heartbeat():
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            stalls.append(time.perf_counter() - started - 0.005)
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.02)
+    try:
+        await work()
+    finally:
+        ticker.cancel()
+    return max(stalls)
+
+
+@pytest.mark.benchmark
+def test_login_burst_does_not_stall_the_event_loop(run, pool, hashed):
+    logins = 32
+    pool.max_pending = logins
+
+    async def inline_burst():
+        for _ in range(logins):
+            server.verify_password("Password123!", hashed)
+            await asyncio.sleep(0)
+
+    async def pooled_burst():
+        await asyncio.gather(*(pool.verify("Password123!", hashed) for _ in range(logins)))
+
+    inline_stall = run(max_loop_stall(inline_burst))
+    pooled_stall = run(max_loop_stall(pooled_burst))
+    print(f"\n{logins} logins: max loop stall inline {inline_stall * 1e3:.1f}ms, pooled {pooled_stall * 1e3:.1f}ms")
+    assert pooled_stall < 0.05
+    assert pooled_stall < inline_stall